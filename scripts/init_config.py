@@ -4,10 +4,16 @@ Initialize configuration for Unraid MCP Server
 """
 
 import os
-import json
 import logging
 from pathlib import Path
 
+import orjson
+
+
+def _env_bool(name: str, default: str = "true") -> bool:
+    """Read a boolean flag from the environment"""
+    return os.getenv(name, default).lower() == "true"
+
 
 def create_default_config():
     """Create default configuration if it doesn't exist"""
@@ -23,7 +29,8 @@ def create_default_config():
             "host": "0.0.0.0",
             "port": int(os.getenv("MCP_PORT", "8080")),
             "workers": int(os.getenv("MAX_WORKERS", "4")),
-            "enable_auth": os.getenv("ENABLE_AUTH", "false").lower() == "true",
+            "max_concurrent_calls": int(os.getenv("MAX_CONCURRENT_CALLS", "32")),
+            "enable_auth": _env_bool("ENABLE_AUTH", "false"),
             "api_key": os.getenv("API_KEY")
         },
         "logging": {
@@ -35,23 +42,23 @@ def create_default_config():
         },
         "tools": {
             "system_diagnostics": {
-                "enabled": os.getenv("ENABLE_SYSTEM_DIAGNOSTICS", "true").lower() == "true",
+                "enabled": _env_bool("ENABLE_SYSTEM_DIAGNOSTICS"),
                 "cache_ttl": 60,
                 "temperature_unit": "celsius"
             },
             "docker_management": {
-                "enabled": os.getenv("ENABLE_DOCKER_MANAGEMENT", "true").lower() == "true",
+                "enabled": _env_bool("ENABLE_DOCKER_MANAGEMENT"),
                 "socket_path": "/var/run/docker.sock",
                 "auto_cleanup": False
             },
             "plex_integration": {
-                "enabled": os.getenv("ENABLE_PLEX_INTEGRATION", "true").lower() == "true",
+                "enabled": _env_bool("ENABLE_PLEX_INTEGRATION"),
                 "url": os.getenv("PLEX_URL"),
                 "token": os.getenv("PLEX_TOKEN"),
                 "timeout": 30
             },
             "log_analysis": {
-                "enabled": os.getenv("ENABLE_LOG_ANALYSIS", "true").lower() == "true",
+                "enabled": _env_bool("ENABLE_LOG_ANALYSIS"),
                 "watch_paths": [
                     "/host/var/log/syslog",
                     "/host/var/log/messages"
@@ -59,7 +66,7 @@ def create_default_config():
                 "max_lines": 1000
             },
             "maintenance": {
-                "enabled": os.getenv("ENABLE_MAINTENANCE", "true").lower() == "true",
+                "enabled": _env_bool("ENABLE_MAINTENANCE"),
                 "cleanup_interval": int(os.getenv("CLEANUP_INTERVAL", "3600"))
             }
         },
@@ -76,8 +83,7 @@ def create_default_config():
     
     config_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(config_file, 'w') as f:
-        json.dump(default_config, f, indent=2)
+    config_file.write_bytes(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
     
     print(f"Created default configuration: {config_file}")
 
@@ -92,8 +98,12 @@ def ensure_directories():
         "/app/data/databases"
     ]
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    # Create shallowest paths first so children skip the ancestor walk
+    created = set()
+    for directory in sorted(directories, key=lambda d: d.count('/')):
+        path = Path(directory)
+        path.mkdir(parents=str(path.parent) not in created, exist_ok=True)
+        created.add(str(path))
         print(f"Ensured directory exists: {directory}")
 
 
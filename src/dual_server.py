@@ -4,33 +4,28 @@ Runs both MCP protocol (stdio) and HTTP interface simultaneously
 """
 
 import asyncio
-import logging
 import signal
 import sys
-from pathlib import Path
-from typing import Optional
 
-# Add src and utils to path for imports
-current_dir = Path(__file__).parent
-utils_dir = current_dir.parent / "utils"
-sys.path.insert(0, str(utils_dir))
-sys.path.insert(0, str(current_dir))
+from utils.logging_config import setup_logging
+from utils.config_manager import ConfigManager
+from utils.event_loop import install_event_loop_policy
 
-from mcp_server import UnraidMCPServer
-from http_server import HTTPServer
-from logging_config import setup_logging
-from config_manager import ConfigManager
+from .mcp_server import UnraidMCPServer
+from .http_server import HTTPServer
 
 
 class DualServer:
     """Dual-mode server running both MCP and HTTP"""
     
+    __slots__ = ("config", "logger", "mcp_server", "http_server", "_stop_event")
+    
     def __init__(self):
         self.config = None
         self.logger = None
         self.mcp_server = None
         self.http_server = None
-        self.tasks = []
+        self._stop_event = asyncio.Event()
         
     async def startup(self):
         """Initialize the application"""
@@ -56,15 +51,6 @@ class DualServer:
         if self.logger:
             self.logger.info("Shutting down Dual-Mode Server...")
         
-        # Cancel all running tasks
-        for task in self.tasks:
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-        
         # Cleanup MCP server
         if self.mcp_server:
             await self.mcp_server.cleanup()
@@ -72,15 +58,20 @@ class DualServer:
         if self.logger:
             self.logger.info("Dual-Mode Server stopped")
     
-    def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.shutdown())
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+    def _request_shutdown(self, signum: signal.Signals):
+        """Signal callback, runs on the event loop thread"""
+        self.logger.info(f"Received signal {signum.name}, initiating shutdown...")
+        self._stop_event.set()
+    
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM through the running loop for a graceful shutdown"""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._request_shutdown, signum)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                pass
     
     async def run_mcp_server(self):
         """Run the MCP server"""
@@ -98,15 +89,20 @@ class DualServer:
     
     async def run(self):
         """Run both servers"""
-        # Start both servers as concurrent tasks
-        mcp_task = asyncio.create_task(self.run_mcp_server())
-        http_task = asyncio.create_task(self.run_http_server())
+        self._install_signal_handlers()
         
-        self.tasks = [mcp_task, http_task]
-        
-        # Wait for both tasks
         try:
-            await asyncio.gather(mcp_task, http_task)
+            # The task group cancels the sibling server if either one fails
+            async with asyncio.TaskGroup() as tg:
+                mcp_task = tg.create_task(self.run_mcp_server())
+                http_task = tg.create_task(self.run_http_server())
+                stop_task = tg.create_task(self._stop_event.wait())
+                
+                # Wait until both servers exit or a shutdown is requested
+                servers = asyncio.gather(mcp_task, http_task, return_exceptions=True)
+                await asyncio.wait({servers, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+                for task in (mcp_task, http_task, stop_task):
+                    task.cancel()
         except Exception as e:
             self.logger.error(f"Server error: {e}", exc_info=True)
         finally:
@@ -118,9 +114,6 @@ async def main():
     server = DualServer()
     
     try:
-        # Setup signal handlers
-        server.setup_signal_handlers()
-        
         # Initialize application
         await server.startup()
         
@@ -136,11 +129,14 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Check Python version
-    if sys.version_info < (3, 8):
-        print("Error: Python 3.8 or higher is required")
+    # Check Python version (asyncio.TaskGroup)
+    if sys.version_info < (3, 11):
+        print("Error: Python 3.11 or higher is required")
         sys.exit(1)
     
+    # Select the event loop for this platform before asyncio.run creates one
+    install_event_loop_policy()
+    
     # Run the application
     try:
         asyncio.run(main())
@@ -3,79 +3,155 @@ HTTP Server Wrapper for Unraid MCP Server
 Provides health checks and basic API endpoints while the main server runs as MCP
 """
 
-import asyncio
 import logging
-from typing import Dict, Any
-from datetime import datetime
-from pathlib import Path
-import sys
+import time
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Route
+import orjson
 import uvicorn
 
-# Add utils and src to path for imports
-current_dir = Path(__file__).parent
-utils_dir = current_dir.parent / "utils"
-sys.path.insert(0, str(utils_dir))
-sys.path.insert(0, str(current_dir))
+from utils.config_manager import ConfigManager
 
-from config_manager import ConfigManager
+# Wall-clock ISO timestamp, re-formatted at most once per second
+_ts_cache = {"t": 0.0, "s": ""}
+
+
+def _now_iso() -> str:
+    """Return the current time as an ISO string, cached for up to one second"""
+    t = time.time()
+    if t - _ts_cache["t"] > 1.0:
+        _ts_cache["s"] = datetime.fromtimestamp(t).isoformat()
+        _ts_cache["t"] = t
+    return _ts_cache["s"]
+
+
+def _uptime_str(seconds: Optional[float]) -> str:
+    """Format MCP uptime the way the original timedelta-based field read ("0:05:12.345678")"""
+    return str(timedelta(seconds=seconds)) if seconds is not None else "None"
+
+
+class _HealthEndpoint:
+    """Raw ASGI endpoint for /health that bypasses FastAPI request handling"""
+    
+    __slots__ = ("server",)
+    
+    def __init__(self, server: "HTTPServer"):
+        self.server = server
+    
+    async def __call__(self, scope, receive, send):
+        query = scope.get("query_string", b"")
+        if query and parse_qs(query.decode("latin-1")).get("detailed") == ["1"]:
+            health_data = await self.server._build_health_detailed()
+        else:
+            health_data = self.server._build_health_fast()
+        
+        body = orjson.dumps(health_data)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
 
 
 class HTTPServer:
     """HTTP server for health checks and basic API"""
     
+    __slots__ = ("config", "mcp_server", "logger", "_http_host", "_http_port", "app")
+    
     def __init__(self, config: ConfigManager, mcp_server=None):
         self.config = config
         self.mcp_server = mcp_server
         self.logger = logging.getLogger(__name__)
         
+        # Resolve listener settings once instead of per request
+        self._http_host = config.get("http.host", "0.0.0.0")
+        self._http_port = config.get("http.port", 9090)
+        
         self.app = FastAPI(
             title="Unraid MCP Server - HTTP Interface",
             description="HTTP interface for Unraid MCP Server health checks and basic API",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         self._setup_routes()
     
+    def _build_health_fast(self) -> Dict[str, Any]:
+        """Health payload built from cached fields only"""
+        health_data = {
+            "status": "healthy",
+            "server": "unraid-mcp-server-http",
+            "version": "1.0.0",
+            "timestamp": _now_iso(),
+            "mcp_server_status": "active" if self.mcp_server else "inactive"
+        }
+        
+        if self.mcp_server:
+            health_data.update({
+                "mcp_tools": self.mcp_server.tool_names,
+                "mcp_uptime": _uptime_str(self.mcp_server.uptime_seconds()),
+                "mcp_status": "running" if self.mcp_server.is_initialized else "initializing"
+            })
+        
+        return health_data
+    
+    async def _build_health_detailed(self) -> Dict[str, Any]:
+        """Health payload including per-tool health checks"""
+        health_data = self._build_health_fast()
+        
+        if self.mcp_server:
+            try:
+                mcp_health = await self.mcp_server.refresh_health()
+                health_data.update({
+                    "mcp_tools": mcp_health["tools"],
+                    "mcp_uptime_seconds": mcp_health["uptime_seconds"],
+                    "mcp_status": mcp_health["status"]
+                })
+                if mcp_health["tool_health"]:
+                    health_data["mcp_tool_health"] = mcp_health["tool_health"]
+            except Exception as e:
+                health_data["mcp_error"] = str(e)
+        
+        return health_data
+    
     def _setup_routes(self):
         """Setup FastAPI routes"""
         
+        # /health is probed constantly, so serve it ahead of the FastAPI router;
+        # /health?detailed=1 includes per-tool health checks
+        self.app.router.routes.insert(0, Route("/health", _HealthEndpoint(self), methods=["GET"]))
+        
+        # Static payloads are built once and shared across requests
+        root_payload = {
+            "message": "Unraid MCP Server - HTTP Interface",
+            "version": "1.0.0",
+            "status": "running",
+            "mcp_server": "active" if self.mcp_server else "inactive",
+            "note": "This is the HTTP interface. For MCP protocol, use stdio connection."
+        }
+        mcp_payload = {
+            "protocol": "mcp",
+            "version": "1.0.0",
+            "server": "unraid-mcp-server",
+            "connection_method": "stdio",
+            "description": "This server implements the Model Context Protocol (MCP) for Unraid system management",
+            "tools_available": (),
+            "usage": "Connect using MCP client (e.g., Claude Desktop) with stdio transport"
+        }
+        
         @self.app.get("/")
         async def root():
             """Root endpoint with basic info"""
-            return {
-                "message": "Unraid MCP Server - HTTP Interface",
-                "version": "1.0.0",
-                "status": "running",
-                "mcp_server": "active" if self.mcp_server else "inactive",
-                "note": "This is the HTTP interface. For MCP protocol, use stdio connection."
-            }
-        
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint"""
-            health_data = {
-                "status": "healthy",
-                "server": "unraid-mcp-server-http",
-                "version": "1.0.0",
-                "timestamp": datetime.now().isoformat(),
-                "mcp_server_status": "active" if self.mcp_server else "inactive"
-            }
-            
-            if self.mcp_server:
-                try:
-                    server_info = await self.mcp_server.get_server_info()
-                    health_data.update({
-                        "mcp_tools": server_info.get("tools", []),
-                        "mcp_uptime": str(server_info.get("uptime", "unknown")),
-                        "mcp_status": server_info.get("status", "unknown")
-                    })
-                except Exception as e:
-                    health_data["mcp_error"] = str(e)
-            
-            return health_data
+            return root_payload
         
         @self.app.get("/status")
         async def status():
@@ -83,15 +159,15 @@ class HTTPServer:
             status_data = {
                 "http_server": {
                     "status": "running",
-                    "port": self.config.get("http.port", 9090),
-                    "host": self.config.get("http.host", "0.0.0.0")
+                    "port": self._http_port,
+                    "host": self._http_host
                 },
                 "mcp_server": {
                     "status": "active" if self.mcp_server else "inactive",
                     "protocol": "stdio",
                     "version": "1.0.0"
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
             if self.mcp_server:
@@ -99,7 +175,8 @@ class HTTPServer:
                     server_info = await self.mcp_server.get_server_info()
                     status_data["mcp_server"].update({
                         "tools": server_info.get("tools", []),
-                        "uptime": str(server_info.get("uptime", "unknown")),
+                        "uptime": _uptime_str(server_info.get("uptime_seconds")),
+                        "uptime_seconds": server_info.get("uptime_seconds"),
                         "description": server_info.get("description", "")
                     })
                 except Exception as e:
@@ -110,15 +187,10 @@ class HTTPServer:
         @self.app.get("/mcp-info")
         async def mcp_info():
             """MCP protocol information"""
-            return {
-                "protocol": "mcp",
-                "version": "1.0.0",
-                "server": "unraid-mcp-server",
-                "connection_method": "stdio",
-                "description": "This server implements the Model Context Protocol (MCP) for Unraid system management",
-                "tools_available": self.mcp_server.tools.keys() if self.mcp_server else [],
-                "usage": "Connect using MCP client (e.g., Claude Desktop) with stdio transport"
-            }
+            if self.mcp_server and mcp_payload["tools_available"] is not self.mcp_server.tool_names:
+                # Tool set changed since the payload was last built
+                mcp_payload["tools_available"] = self.mcp_server.tool_names
+            return mcp_payload
         
         @self.app.get("/tools")
         async def list_tools():
@@ -126,30 +198,19 @@ class HTTPServer:
             if not self.mcp_server:
                 return {"error": "MCP server not available"}
             
-            tools_info = {}
-            for tool_name, tool_instance in self.mcp_server.tools.items():
-                try:
-                    tool_definitions = await tool_instance.get_tool_definitions()
-                    tools_info[tool_name] = {
-                        "tools": [tool.name for tool in tool_definitions],
-                        "description": tool_definitions[0].description if tool_definitions else "No description"
-                    }
-                except Exception as e:
-                    tools_info[tool_name] = {"error": str(e)}
-            
-            return tools_info
+            return self.mcp_server.tools_info
     
     async def run(self):
         """Run the HTTP server"""
-        host = self.config.get("http.host", "0.0.0.0")
-        port = self.config.get("http.port", 9090)
-        
         config = uvicorn.Config(
             self.app,
-            host=host,
-            port=port,
-            log_level="info",
-            access_log=True
+            host=self._http_host,
+            port=self._http_port,
+            log_level="warning",
+            access_log=False,
+            loop="auto",
+            http="httptools",
+            lifespan="on"
         )
         
         server = uvicorn.Server(config)
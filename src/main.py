@@ -4,29 +4,26 @@ Unraid MCP Server - Main Entry Point
 """
 
 import asyncio
-import logging
 import signal
 import sys
-from pathlib import Path
 
-# Add src and utils to path for local imports
-current_dir = Path(__file__).parent
-utils_dir = current_dir.parent / "utils"
-sys.path.insert(0, str(utils_dir))
-sys.path.insert(0, str(current_dir))
+from utils.logging_config import setup_logging
+from utils.config_manager import ConfigManager
+from utils.event_loop import install_event_loop_policy
 
-from mcp_server import UnraidMCPServer
-from logging_config import setup_logging
-from config_manager import ConfigManager
+from .mcp_server import UnraidMCPServer
 
 
 class Application:
     """Main application class"""
     
+    __slots__ = ("mcp_server", "config", "logger", "_stop_event")
+    
     def __init__(self):
         self.mcp_server = None
         self.config = None
         self.logger = None
+        self._stop_event = asyncio.Event()
         
     async def startup(self):
         """Initialize the application"""
@@ -54,15 +51,41 @@ class Application:
         if self.logger:
             self.logger.info("Unraid MCP Server stopped")
     
-    def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.shutdown())
-            sys.exit(0)
+    def _request_shutdown(self, signum: signal.Signals):
+        """Signal callback, runs on the event loop thread"""
+        self.logger.info(f"Received signal {signum.name}, initiating shutdown...")
+        self._stop_event.set()
+    
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM through the running loop for a graceful shutdown"""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._request_shutdown, signum)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                pass
+    
+    async def run(self):
+        """Run the MCP server until it exits or a shutdown is requested"""
+        self._install_signal_handlers()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        server_task = asyncio.create_task(self.mcp_server.run())
+        stop_task = asyncio.create_task(self._stop_event.wait())
+        try:
+            await asyncio.wait({server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_task.cancel()
+            if not server_task.done():
+                server_task.cancel()
+                try:
+                    await server_task
+                except asyncio.CancelledError:
+                    pass
+        
+        if not server_task.cancelled():
+            # Propagate errors raised by the MCP server loop
+            server_task.result()
 
 
 async def main():
@@ -70,14 +93,11 @@ async def main():
     app = Application()
     
     try:
-        # Setup signal handlers
-        app.setup_signal_handlers()
-        
         # Initialize application
         await app.startup()
         
         # Run the MCP server
-        await app.mcp_server.run()
+        await app.run()
         
     except Exception as e:
         if app.logger:
@@ -90,11 +110,14 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Check Python version
-    if sys.version_info < (3, 8):
-        print("Error: Python 3.8 or higher is required")
+    # Check Python version (datetime.fromisoformat with a trailing Z)
+    if sys.version_info < (3, 11):
+        print("Error: Python 3.11 or higher is required")
         sys.exit(1)
     
+    # Select the event loop for this platform before asyncio.run creates one
+    install_event_loop_policy()
+    
     # Run the application
     try:
         asyncio.run(main())
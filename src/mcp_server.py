@@ -4,32 +4,167 @@ Simple MCP protocol implementation without external dependencies
 """
 
 import asyncio
-import json
+import functools
+import importlib
 import logging
+import os
+import stat
 import sys
-from typing import Dict, List, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
-from pathlib import Path
 
-# Add utils and src to path for imports
-current_dir = Path(__file__).parent
-utils_dir = current_dir.parent / "utils"
-sys.path.insert(0, str(utils_dir))
-sys.path.insert(0, str(current_dir))
+import orjson
 
-# Import tool modules
-from tools.system_diagnostics import SystemDiagnostics
-from tools.docker_management import DockerManagement
-from tools.plex_integration import PlexIntegration
-from tools.log_analysis import LogAnalysis
-from tools.maintenance import Maintenance
+from utils.config_manager import ConfigManager
+from .tools import SupportsCleanup, SupportsHealthCheck, Tool
 
-from config_manager import ConfigManager
+# (config key, class name, display name, preload) for each tool module, in registration order.
+# Modules live in .tools.<config key> and are imported only when enabled, so a
+# disabled tool never loads its dependency tree (docker, aiohttp, watchdog, ...).
+# A module's initialize() runs on first use unless it is preloaded because it
+# starts background work of its own.
+TOOL_MODULES = (
+    ("system_diagnostics", "SystemDiagnostics", "System Diagnostics", False),
+    ("docker_management", "DockerManagement", "Docker Management", False),
+    ("plex_integration", "PlexIntegration", "Plex Integration", False),
+    ("log_analysis", "LogAnalysis", "Log Analysis", False),
+    ("maintenance", "Maintenance", "Maintenance", True),
+)
+TOOL_LABELS = {tool_name: label for tool_name, _, label, _ in TOOL_MODULES}
+
+# Resources advertised by resources/list; fixed, so built once
+STATIC_RESOURCES = (
+    {
+        "uri": "unraid://system/overview",
+        "name": "System Overview",
+        "description": "Current system status and health",
+        "mimeType": "application/json"
+    },
+    {
+        "uri": "unraid://system/health",
+        "name": "System Health",
+        "description": "Detailed system health information",
+        "mimeType": "application/json"
+    },
+    {
+        "uri": "unraid://docker/containers",
+        "name": "Docker Containers",
+        "description": "List of running Docker containers",
+        "mimeType": "application/json"
+    },
+    {
+        "uri": "unraid://plex/status",
+        "name": "Plex Status",
+        "description": "Plex server status and statistics",
+        "mimeType": "application/json"
+    },
+)
+
+# resources/read URI -> (tool module, method) serving it
+RESOURCE_ROUTES = {
+    "unraid://system/overview": ("system_diagnostics", "get_system_overview"),
+    "unraid://system/health": ("system_diagnostics", "check_system_health"),
+    "unraid://docker/containers": ("docker_management", "list_containers"),
+    "unraid://plex/status": ("plex_integration", "get_plex_status"),
+}
+
+# Read-only status queries whose results may be reused for cache.tool_result_ttl seconds
+CACHEABLE_TOOLS = frozenset({
+    "system_diagnostics.get_system_overview",
+    "system_diagnostics.check_system_health",
+    "plex_integration.get_plex_status",
+})
+
+# initialize result; constant, so every response shares this one object
+INIT_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {},
+        "resources": {},
+        "prompts": {}
+    },
+    "serverInfo": {
+        "name": "unraid-mcp-server",
+        "version": "1.0.0"
+    }
+}
+
+# Shared stand-in for missing params/arguments; handlers never mutate it
+EMPTY_ARGUMENTS: Dict[str, Any] = {}
+
+# List results longer than this are split into several content blocks, each one
+# a complete JSON array of up to CHUNK_ITEMS records
+CHUNK_LIST_THRESHOLD = 100
+CHUNK_ITEMS = 64
+
+# Longest JSON-RPC line accepted on stdin
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+# Upper bounds (seconds) on a single tool's health check and cleanup
+HEALTH_CHECK_TIMEOUT = 10
+CLEANUP_TIMEOUT = 30
+
+
+def _to_text(result: Any) -> str:
+    """Render a tool result as JSON text for MCP content blocks"""
+    if isinstance(result, str):
+        return result
+    try:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # Objects orjson cannot encode keep their repr
+        return str(result)
+
+
+def _to_content(result: Any) -> List[Dict[str, str]]:
+    """Build MCP text content blocks; every block is a complete JSON document
+    
+    A long list result is split at record boundaries into consecutive arrays, so a
+    client reassembles it by concatenating the blocks' arrays in order. Anything
+    else has no safe split point and stays a single block.
+    """
+    if isinstance(result, list) and len(result) > CHUNK_LIST_THRESHOLD:
+        return [
+            {"type": "text", "text": _to_text(result[i:i + CHUNK_ITEMS])}
+            for i in range(0, len(result), CHUNK_ITEMS)
+        ]
+    return [{"type": "text", "text": _to_text(result)}]
+
+
+def _tool_handler(tool_instance: Any, method: str) -> Optional[Callable[[Dict[str, Any]], Awaitable[Any]]]:
+    """Resolve a tool method once into a handler(arguments) coroutine function"""
+    if hasattr(tool_instance, 'handle_call'):
+        return functools.partial(tool_instance.handle_call, method)
+    
+    method_func = getattr(tool_instance, method, None)
+    if method_func is None:
+        return None
+    if asyncio.iscoroutinefunction(method_func):
+        return lambda arguments: method_func(**arguments)
+    
+    async def call_sync(arguments: Dict[str, Any]) -> Any:
+        return method_func(**arguments)
+    
+    return call_sync
 
 
 class SimpleMCPServer:
     """Simple MCP Server implementation"""
     
+    __slots__ = (
+        "config", "logger", "tools", "_tool_init",
+        "_tool_defs", "_tool_list", "_tools_list_result",
+        "_dispatch", "_method_resolve_cache", "_method_handlers",
+        "_tools_info_cache", "_tool_names_tuple",
+        "_health_fns", "_cleanup_fns", "is_initialized",
+        "started_at", "start_time_ts", "request_id", "_bg_tasks", "_loop",
+        "_periodic_handle", "_periodic_jobs", "_health_inflight", "_last_health",
+        "_health_interval", "_cleanup_interval",
+        "_max_concurrent_calls", "_result_ttl", "_result_cache", "_result_locks",
+    )
+    
     def __init__(self, config: ConfigManager):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -37,22 +172,88 @@ class SimpleMCPServer:
         # Tool instances
         self.tools: Dict[str, Any] = {}
         
+        # Per-module initialize() futures, created on first use
+        self._tool_init: Dict[str, asyncio.Future] = {}
+        
+        # Static tool metadata, built once the tool set is known
+        self._tool_defs: Dict[str, List[Tool]] = {}
+        self._tool_list: List[Dict[str, Any]] = []
+        self._tools_list_result: Dict[str, Any] = {"tools": self._tool_list}
+        self._dispatch: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Awaitable[Any]]]] = {}
+        self._tools_info_cache: Dict[str, Any] = {}
+        self._tool_names_tuple: tuple = ()
+        
+        # (module, method) -> (bound method, is coroutine function) for tools without handle_call
+        self._method_resolve_cache: Dict[Tuple[str, str], Tuple[Callable[..., Any], bool]] = {}
+        
+        # Tools exposing optional hooks, resolved once after initialization
+        self._health_fns: List[Tuple[str, Callable[[], Awaitable[Dict[str, Any]]]]] = []
+        self._cleanup_fns: List[Tuple[str, Callable[[], Awaitable[None]]]] = []
+        
         # Server state
         self.is_initialized = False
-        self.start_time = None
+        self.started_at: Optional[str] = None
+        self.start_time_ts: Optional[float] = None
         
         # Request ID counter
         self.request_id = 0
         
+        # JSON-RPC method name -> handler
+        self._method_handlers: Dict[str, Callable[[Dict[str, Any], Any], Awaitable[Dict[str, Any]]]] = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_list_tools,
+            "tools/call": self._handle_call_tool,
+            "resources/list": self._handle_list_resources,
+            "resources/read": self._handle_read_resource,
+        }
+        
+        # Upper bound on requests handled concurrently by the stdio loop
+        self._max_concurrent_calls = max(1, int(config.get("server.max_concurrent_calls", 32)))
+        
+        # Short-lived results of read-only tool calls; concurrent misses on a key share one fetch
+        self._result_ttl = float(config.get("cache.tool_result_ttl", 5)) if config.get("cache.enabled", True) else 0.0
+        self._result_cache: Dict[str, Tuple[float, Any]] = {}
+        self._result_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Background tasks owned by the server
+        self._bg_tasks: set[asyncio.Task] = set()
+        
+        # Loop the server runs on, captured once in initialize()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Periodic jobs as [due loop time, interval, tick, running], all driven by
+        # one timer armed for the earliest due job
+        self._periodic_handle: Optional[asyncio.TimerHandle] = None
+        self._periodic_jobs: List[list] = []
+        
+        # Periodic intervals (seconds)
+        self._health_interval = float(config.get("health.check_interval", 60))
+        self._cleanup_interval = float(config.get("tools.maintenance.cleanup_interval", 3600))
+        
+        # Health collection in progress (shared by concurrent callers) and last logged state
+        self._health_inflight: Optional[asyncio.Future] = None
+        self._last_health = None
+        
     async def initialize(self):
         """Initialize the MCP server and all tools"""
         try:
             self.logger.info("Initializing Unraid MCP Server...")
-            self.start_time = datetime.now()
+            
+            # Python 3.12+: let tasks that finish without suspending skip the scheduler
+            loop = self._loop = asyncio.get_running_loop()
+            if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+                loop.set_task_factory(asyncio.eager_task_factory)
+            
+            # Wall-clock start is only ever reported, so format it once
+            self.started_at = datetime.now().isoformat()
+            self.start_time_ts = time.monotonic()
             
             # Initialize tool modules
             await self._initialize_tools()
             
+            # Cache tool metadata for status endpoints
+            await self.invalidate_tools_cache()
+            
             # Setup periodic tasks
             await self._setup_periodic_tasks()
             
@@ -64,114 +265,265 @@ class SimpleMCPServer:
             raise
     
     async def _initialize_tools(self):
-        """Initialize all tool modules"""
+        """Register all enabled tool modules"""
         tool_configs = self.config.get("tools", {})
         
-        # System Diagnostics
-        if tool_configs.get("system_diagnostics", {}).get("enabled", True):
-            self.tools["system_diagnostics"] = SystemDiagnostics(
-                self.config.get("tools.system_diagnostics", {})
-            )
-            await self.tools["system_diagnostics"].initialize()
-            self.logger.info("System Diagnostics tool initialized")
+        # Construction is cheap and enough to serve tool metadata; the I/O-heavy
+        # initialize() is deferred to the first call that needs the module
+        for tool_name, class_name, label, preload in TOOL_MODULES:
+            tool_config = tool_configs.get(tool_name, {})
+            if tool_config.get("enabled", True):
+                module = importlib.import_module(f".tools.{tool_name}", __package__)
+                self.tools[tool_name] = getattr(module, class_name)(tool_config)
+                self.logger.info(f"{label} tool registered")
+                if preload:
+                    self._start_tool_init(tool_name)
         
-        # Docker Management
-        if tool_configs.get("docker_management", {}).get("enabled", True):
-            self.tools["docker_management"] = DockerManagement(
-                self.config.get("tools.docker_management", {})
-            )
-            await self.tools["docker_management"].initialize()
-            self.logger.info("Docker Management tool initialized")
+        # Resolve optional hooks once instead of probing on every tick
+        self._health_fns = [
+            (n, t.health_check) for n, t in self.tools.items() if isinstance(t, SupportsHealthCheck)
+        ]
+        self._cleanup_fns = [
+            (n, t.cleanup) for n, t in self.tools.items() if isinstance(t, SupportsCleanup)
+        ]
+    
+    def _start_tool_init(self, tool_name: str) -> asyncio.Future:
+        """Start (or join) a module's initialize(); a failed attempt is retried on next use"""
+        init = self._tool_init.get(tool_name)
+        if init is None:
+            init = self._tool_init[tool_name] = asyncio.ensure_future(self.tools[tool_name].initialize())
+            init.add_done_callback(functools.partial(self._on_tool_init_done, tool_name))
+        return init
+    
+    def _on_tool_init_done(self, tool_name: str, init: asyncio.Future):
+        """Log the outcome of a module's initialize()"""
+        if init.cancelled():
+            self._tool_init.pop(tool_name, None)
+        elif init.exception() is not None:
+            self.logger.error(f"Failed to initialize {TOOL_LABELS[tool_name]} tool: {init.exception()}")
+            self._tool_init.pop(tool_name, None)
+        else:
+            self.logger.info(f"{TOOL_LABELS[tool_name]} tool initialized")
+    
+    def _tool_ready(self, tool_name: str) -> bool:
+        """True once a module's initialize() has completed successfully"""
+        init = self._tool_init.get(tool_name)
+        return init is not None and init.done() and not init.cancelled() and init.exception() is None
+    
+    async def _get_tool(self, tool_name: str) -> Any:
+        """Return an initialized tool module, initializing it on first use"""
+        await asyncio.shield(self._start_tool_init(tool_name))
+        return self.tools[tool_name]
+    
+    async def invalidate_tools_cache(self):
+        """Rebuild cached tool metadata after the tool set changes"""
+        self._tool_names_tuple = tuple(self.tools.keys())
         
-        # Plex Integration
-        if tool_configs.get("plex_integration", {}).get("enabled", True):
-            self.tools["plex_integration"] = PlexIntegration(
-                self.config.get("tools.plex_integration", {})
-            )
-            await self.tools["plex_integration"].initialize()
-            self.logger.info("Plex Integration tool initialized")
+        # Tool definitions are static per module, so fetch them once here
+        tool_defs = {}
+        tools_info = {}
+        for tool_name, tool_instance in self.tools.items():
+            try:
+                tool_definitions = await tool_instance.get_tool_definitions()
+            except Exception as e:
+                # Keep serving the last good definitions rather than dropping the module
+                tool_definitions = self._tool_defs.get(tool_name)
+                if tool_definitions is None:
+                    self.logger.error(f"Error getting tools from {tool_name}: {e}")
+                    tools_info[tool_name] = {"error": str(e)}
+                    continue
+                self.logger.warning(f"Error refreshing tools from {tool_name}, keeping previous definitions: {e}")
+            
+            tool_defs[tool_name] = tool_definitions
+            tools_info[tool_name] = {
+                "tools": [tool.name for tool in tool_definitions],
+                "description": tool_definitions[0].description if tool_definitions else "No description"
+            }
         
-        # Log Analysis
-        if tool_configs.get("log_analysis", {}).get("enabled", True):
-            self.tools["log_analysis"] = LogAnalysis(
-                self.config.get("tools.log_analysis", {})
-            )
-            await self.tools["log_analysis"].initialize()
-            self.logger.info("Log Analysis tool initialized")
+        self._tool_defs = tool_defs
+        self._tools_info_cache = tools_info
+        self._tool_list = [
+            {
+                "name": f"{tool_name}.{tool_def.name}",
+                "description": tool_def.description,
+                "inputSchema": tool_def.inputSchema
+            }
+            for tool_name, tool_definitions in tool_defs.items()
+            for tool_def in tool_definitions
+        ]
+        self._tools_list_result = {"tools": self._tool_list}
         
-        # Maintenance
-        if tool_configs.get("maintenance", {}).get("enabled", True):
-            self.tools["maintenance"] = Maintenance(
-                self.config.get("tools.maintenance", {})
-            )
-            await self.tools["maintenance"].initialize()
-            self.logger.info("Maintenance tool initialized")
+        # "module.method" -> (module, handler taking the arguments dict), for the tools/call fast path
+        self._dispatch = {}
+        for tool_name, tool_definitions in tool_defs.items():
+            for tool_def in tool_definitions:
+                handler = _tool_handler(self.tools[tool_name], tool_def.name)
+                if handler is not None:
+                    self._dispatch[f"{tool_name}.{tool_def.name}"] = (tool_name, handler)
+        self._method_resolve_cache.clear()
+    
+    @property
+    def tools_info(self) -> Dict[str, Any]:
+        """Cached per-module tool summaries"""
+        return self._tools_info_cache
+    
+    @property
+    def tool_names(self) -> tuple:
+        """Cached names of the loaded tool modules"""
+        return self._tool_names_tuple
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a background task and keep a reference so it can be cancelled"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
     
     async def _setup_periodic_tasks(self):
         """Setup periodic background tasks"""
-        # Health monitoring task
-        asyncio.create_task(self._health_monitor())
+        now = self._loop.time()
+        self._periodic_jobs = [
+            # Health monitoring (every minute by default)
+            [now + self._health_interval, self._health_interval, self._health_tick, False],
+            # Cleanup (every hour by default)
+            [now + self._cleanup_interval, self._cleanup_interval, self._cleanup_tick, False],
+        ]
+        self._arm_periodic()
+    
+    def _arm_periodic(self):
+        """Point the single periodic timer at the earliest job that is not running"""
+        if self._periodic_handle is not None:
+            self._periodic_handle.cancel()
+            self._periodic_handle = None
         
-        # Cleanup tasks
-        asyncio.create_task(self._cleanup_tasks())
+        due = [job[0] for job in self._periodic_jobs if not job[3]]
+        if due:
+            self._periodic_handle = self._loop.call_at(min(due), self._run_due_jobs)
     
-    async def _health_monitor(self):
-        """Periodic health monitoring"""
-        while True:
-            try:
-                await asyncio.sleep(60)  # Check every minute
-                
-                # Log health status
-                if self.is_initialized:
-                    self.logger.debug("MCP Server health check passed")
-                    
-            except Exception as e:
-                self.logger.error(f"Health monitoring error: {e}")
+    def _run_due_jobs(self):
+        """Timer callback: start every job whose time has come"""
+        self._periodic_handle = None
+        now = self._loop.time()
+        for job in self._periodic_jobs:
+            if not job[3] and job[0] <= now:
+                job[3] = True
+                self._spawn(self._run_periodic(job))
+        self._arm_periodic()
     
-    async def _cleanup_tasks(self):
-        """Periodic cleanup tasks"""
-        while True:
-            try:
-                await asyncio.sleep(3600)  # Run every hour
-                
-                # Perform cleanup tasks
-                for tool_name, tool_instance in self.tools.items():
-                    if hasattr(tool_instance, 'cleanup'):
-                        try:
-                            await tool_instance.cleanup()
-                        except Exception as e:
-                            self.logger.error(f"Cleanup error in {tool_name}: {e}")
-                
-                self.logger.debug("Periodic cleanup completed")
+    async def _run_periodic(self, job: list):
+        """Run one tick of a job, then book its next slot"""
+        await job[2]()
+        
+        job[0] = self._next_deadline(job[0], job[1], self._loop.time())
+        job[3] = False
+        self._arm_periodic()
+    
+    @staticmethod
+    def _next_deadline(deadline: float, interval: float, now: float) -> float:
+        """Advance a deadline by whole intervals so ticks stay on a fixed cadence"""
+        deadline += interval
+        if deadline <= now:
+            # The tick overran one or more periods; skip them rather than run back-to-back
+            deadline += ((now - deadline) // interval + 1) * interval
+        return deadline
+    
+    async def collect_health(self) -> Dict[str, Any]:
+        """Collect server status and per-tool health"""
+        # Only modules that have been initialized have anything to report
+        health_fns = [(n, fn) for n, fn in self._health_fns if self._tool_ready(n)]
+        
+        # Tool health checks are independent, so overlap their I/O; a stuck
+        # backend is cut off rather than holding up the whole tick
+        results = await asyncio.gather(
+            *(asyncio.wait_for(health_check(), HEALTH_CHECK_TIMEOUT) for _, health_check in health_fns),
+            return_exceptions=True
+        )
+        tool_health = {}
+        for (tool_name, _), result in zip(health_fns, results):
+            if isinstance(result, TimeoutError):
+                tool_health[tool_name] = {"error": f"health check timed out after {HEALTH_CHECK_TIMEOUT}s"}
+            elif isinstance(result, Exception):
+                tool_health[tool_name] = {"error": str(result)}
+            else:
+                tool_health[tool_name] = result
+        
+        return {
+            "status": "running" if self.is_initialized else "initializing",
+            "tools": self._tool_names_tuple,
+            "uptime_seconds": self.uptime_seconds(),
+            "tool_health": tool_health
+        }
+    
+    def uptime_seconds(self) -> Optional[float]:
+        """Seconds since initialize(), from the monotonic clock"""
+        if self.start_time_ts is None:
+            return None
+        return time.monotonic() - self.start_time_ts
+    
+    async def refresh_health(self) -> Dict[str, Any]:
+        """Collect health now, joining a collection that is already in flight"""
+        inflight = self._health_inflight
+        if inflight is None or inflight.done():
+            inflight = self._health_inflight = asyncio.ensure_future(self.collect_health())
+        return await asyncio.shield(inflight)
+    
+    async def _health_tick(self):
+        """Run one health check"""
+        try:
+            # Log only when the health picture changes
+            health = await self.refresh_health()
+            current = (health["status"], health["tool_health"])
+            if current != self._last_health:
+                self.logger.debug("MCP Server health: %s, tools: %s", health["status"], health["tool_health"])
+                self._last_health = current
                 
-            except Exception as e:
-                self.logger.error(f"Cleanup task error: {e}")
+        except Exception as e:
+            self.logger.error(f"Health monitoring error: {e}")
+    
+    async def _run_tool_cleanups(self) -> List[Tuple[str, str]]:
+        """Run every tool cleanup concurrently; return (tool, error) for failures"""
+        # Modules never initialized hold nothing to release
+        cleanup_fns = [(n, fn) for n, fn in self._cleanup_fns if self._tool_ready(n)]
+        results = await asyncio.gather(
+            *(asyncio.wait_for(cleanup(), CLEANUP_TIMEOUT) for _, cleanup in cleanup_fns),
+            return_exceptions=True
+        )
+        failures = []
+        for (tool_name, _), result in zip(cleanup_fns, results):
+            if isinstance(result, TimeoutError):
+                failures.append((tool_name, f"timed out after {CLEANUP_TIMEOUT}s"))
+            elif isinstance(result, Exception):
+                failures.append((tool_name, str(result)))
+        return failures
+    
+    async def _cleanup_tick(self):
+        """Run one round of tool cleanup"""
+        try:
+            for tool_name, error in await self._run_tool_cleanups():
+                self.logger.error(f"Cleanup error in {tool_name}: {error}")
+            
+            self.logger.debug("Periodic cleanup completed")
+            
+        except Exception as e:
+            self.logger.error(f"Cleanup task error: {e}")
     
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP protocol requests"""
         try:
             method = request.get("method")
-            params = request.get("params", {})
+            params = request.get("params") or EMPTY_ARGUMENTS
             request_id = request.get("id")
             
-            self.logger.debug(f"Handling MCP request: {method}")
+            self.logger.debug("Handling MCP request: %s", method)
             
-            if method == "initialize":
-                return await self._handle_initialize(params, request_id)
-            elif method == "tools/list":
-                return await self._handle_list_tools(params, request_id)
-            elif method == "tools/call":
-                return await self._handle_call_tool(params, request_id)
-            elif method == "resources/list":
-                return await self._handle_list_resources(params, request_id)
-            elif method == "resources/read":
-                return await self._handle_read_resource(params, request_id)
-            else:
+            handler = self._method_handlers.get(method)
+            if handler is None:
                 return self._create_error_response(
                     request_id, 
                     -32601, 
                     f"Method not found: {method}"
                 )
+            return await handler(params, request_id)
                 
         except Exception as e:
             self.logger.error(f"Error handling request: {e}", exc_info=True)
@@ -186,89 +538,69 @@ class SimpleMCPServer:
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {},
-                    "resources": {},
-                    "prompts": {}
-                },
-                "serverInfo": {
-                    "name": "unraid-mcp-server",
-                    "version": "1.0.0"
-                }
-            }
+            "result": INIT_RESULT
         }
     
     async def _handle_list_tools(self, params: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle tools/list request"""
-        tools = []
-        
-        for tool_name, tool_instance in self.tools.items():
-            try:
-                tool_definitions = await tool_instance.get_tool_definitions()
-                for tool_def in tool_definitions:
-                    tools.append({
-                        "name": f"{tool_name}.{tool_def.name}",
-                        "description": tool_def.description,
-                        "inputSchema": tool_def.inputSchema
-                    })
-            except Exception as e:
-                self.logger.error(f"Error getting tools from {tool_name}: {e}")
-        
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "result": {
-                "tools": tools
-            }
+            "result": self._tools_list_result
         }
     
     async def _handle_call_tool(self, params: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle tools/call request"""
         try:
             name = params.get("name")
-            arguments = params.get("arguments", {})
-            
-            self.logger.debug(f"Handling tool call: {name} with args: {arguments}")
-            
-            # Parse tool name to get module and method
-            if "." in name:
-                tool_module, method = name.split(".", 1)
-            else:
-                tool_module = name
-                method = "default"
-            
-            if tool_module not in self.tools:
-                raise ValueError(f"Tool module '{tool_module}' not found")
+            arguments = params.get("arguments") or EMPTY_ARGUMENTS
             
-            tool_instance = self.tools[tool_module]
+            self.logger.debug("Handling tool call: %s with args: %s", name, arguments)
             
-            # Call the tool method
-            if hasattr(tool_instance, 'handle_call'):
-                result = await tool_instance.handle_call(method, arguments)
+            route = self._dispatch.get(name)
+            if route is not None:
+                # Fast path: registered tool, handle_call pre-bound to its method
+                tool_name, handler = route
+                if not self._tool_ready(tool_name):
+                    await self._get_tool(tool_name)
+                if name in CACHEABLE_TOOLS and self._result_ttl > 0:
+                    result = await self._call_cached(name, handler, arguments)
+                else:
+                    result = await handler(arguments)
             else:
-                # Fallback to direct method call
-                if hasattr(tool_instance, method):
-                    method_func = getattr(tool_instance, method)
-                    if asyncio.iscoroutinefunction(method_func):
-                        result = await method_func(**arguments)
-                    else:
-                        result = method_func(**arguments)
+                # Slow path: parse tool name to get module and method
+                tool_module, sep, method = name.partition(".")
+                if not sep:
+                    method = "default"
+                
+                if tool_module not in self.tools:
+                    raise ValueError(f"Tool module '{tool_module}' not found")
+                
+                tool_instance = await self._get_tool(tool_module)
+                
+                # Call the tool method
+                if hasattr(tool_instance, 'handle_call'):
+                    result = await tool_instance.handle_call(method, arguments)
                 else:
-                    raise ValueError(f"Method '{method}' not found in tool '{tool_module}'")
+                    # Fallback to direct method call, resolved once per (module, method)
+                    key = (tool_module, method)
+                    resolved = self._method_resolve_cache.get(key)
+                    if resolved is None:
+                        if not hasattr(tool_instance, method):
+                            raise ValueError(f"Method '{method}' not found in tool '{tool_module}'")
+                        method_func = getattr(tool_instance, method)
+                        resolved = self._method_resolve_cache[key] = (
+                            method_func, asyncio.iscoroutinefunction(method_func)
+                        )
+                    method_func, is_coro = resolved
+                    result = await method_func(**arguments) if is_coro else method_func(**arguments)
             
             # Convert result to MCP format
-            if isinstance(result, dict):
-                content = [{"type": "text", "text": str(result)}]
-            else:
-                content = [{"type": "text", "text": str(result)}]
-            
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
-                    "content": content
+                    "content": _to_content(result)
                 }
             }
             
@@ -280,39 +612,54 @@ class SimpleMCPServer:
                 f"Tool call error: {str(e)}"
             )
     
+    async def _call_cached(self, name: str, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                           arguments: Dict[str, Any]) -> Any:
+        """Call a read-only tool through the short-lived result cache"""
+        key = name + orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS).decode()
+        
+        entry = self._result_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        # One lock per key, created on the first miss and dropped with the cache entry
+        lock = self._result_locks.get(key)
+        if lock is None:
+            lock = self._result_locks[key] = asyncio.Lock()
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            entry = self._result_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            
+            result = await handler(arguments)
+            
+            # Failed calls are not cached so the next request retries the backend
+            if not (isinstance(result, dict) and result.get("status") == "error"):
+                now = time.monotonic()
+                self._result_cache[key] = (now + self._result_ttl, result)
+                if len(self._result_cache) > 256:
+                    # Argument variety is small in practice; drop stale keys when it is not
+                    for stale in [k for k, (expires, _) in self._result_cache.items() if expires <= now]:
+                        self._evict_result(stale)
+        
+        # An uncached failure leaves nothing for the lock to guard
+        if key not in self._result_cache:
+            self._evict_result(key)
+        return result
+    
+    def _evict_result(self, key: str) -> None:
+        """Drop a cached result together with its lock, unless a call on it is in flight"""
+        self._result_cache.pop(key, None)
+        lock = self._result_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._result_locks[key]
+    
     async def _handle_list_resources(self, params: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle resources/list request"""
         uri = params.get("uri", "")
-        resources = []
-        
-        # Add system information as resources
-        if uri == "unraid://" or uri == "":
-            resources.extend([
-                {
-                    "uri": "unraid://system/overview",
-                    "name": "System Overview",
-                    "description": "Current system status and health",
-                    "mimeType": "application/json"
-                },
-                {
-                    "uri": "unraid://system/health",
-                    "name": "System Health",
-                    "description": "Detailed system health information",
-                    "mimeType": "application/json"
-                },
-                {
-                    "uri": "unraid://docker/containers",
-                    "name": "Docker Containers",
-                    "description": "List of running Docker containers",
-                    "mimeType": "application/json"
-                },
-                {
-                    "uri": "unraid://plex/status",
-                    "name": "Plex Status",
-                    "description": "Plex server status and statistics",
-                    "mimeType": "application/json"
-                }
-            ])
+        
+        # System information resources live under the root URI
+        resources = STATIC_RESOURCES if uri == "unraid://" or uri == "" else ()
         
         return {
             "jsonrpc": "2.0",
@@ -327,53 +674,18 @@ class SimpleMCPServer:
         try:
             uri = params.get("uri")
             
-            if uri.startswith("unraid://system/overview"):
-                # Get system overview
-                if "system_diagnostics" in self.tools:
-                    result = await self.tools["system_diagnostics"].handle_call("get_system_overview", {})
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "contents": [{"type": "text", "text": str(result)}]
-                        }
-                    }
-            
-            elif uri.startswith("unraid://system/health"):
-                # Get system health
-                if "system_diagnostics" in self.tools:
-                    result = await self.tools["system_diagnostics"].handle_call("check_system_health", {})
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "contents": [{"type": "text", "text": str(result)}]
-                        }
-                    }
-            
-            elif uri.startswith("unraid://docker/containers"):
-                # Get Docker containers
-                if "docker_management" in self.tools:
-                    result = await self.tools["docker_management"].handle_call("list_containers", {})
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "contents": [{"type": "text", "text": str(result)}]
-                        }
-                    }
-            
-            elif uri.startswith("unraid://plex/status"):
-                # Get Plex status
-                if "plex_integration" in self.tools:
-                    result = await self.tools["plex_integration"].handle_call("get_plex_status", {})
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "contents": [{"type": "text", "text": str(result)}]
-                        }
+            route = RESOURCE_ROUTES.get(uri)
+            if route is not None and route[0] in self.tools:
+                tool_name, method = route
+                tool_instance = await self._get_tool(tool_name)
+                result = await tool_instance.handle_call(method, {})
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "contents": [{"type": "text", "text": _to_text(result)}]
                     }
+                }
             
             raise ValueError(f"Unknown resource: {uri}")
             
@@ -402,8 +714,10 @@ class SimpleMCPServer:
             "name": "unraid-mcp-server",
             "version": "1.0.0",
             "description": "MCP Server for Unraid System Management",
-            "tools": list(self.tools.keys()),
-            "uptime": datetime.now() - self.start_time if self.start_time else None,
+            "tools": self._tool_names_tuple,
+            "tool_count": len(self._tool_list),
+            "started_at": self.started_at,
+            "uptime_seconds": self.uptime_seconds(),
             "status": "running" if self.is_initialized else "initializing"
         }
     
@@ -411,43 +725,113 @@ class SimpleMCPServer:
         """Cleanup resources"""
         self.logger.info("Cleaning up MCP server...")
         
-        # Cleanup tools
-        for tool_name, tool_instance in self.tools.items():
-            if hasattr(tool_instance, 'cleanup'):
-                try:
-                    await tool_instance.cleanup()
-                except Exception as e:
-                    self.logger.error(f"Error cleaning up {tool_name}: {e}")
+        # Stop timers and background tasks before tearing down the tools they use
+        if self._periodic_handle is not None:
+            self._periodic_handle.cancel()
+            self._periodic_handle = None
+        self._periodic_jobs = []
+        if self._health_inflight is not None:
+            self._health_inflight.cancel()
+        for init in self._tool_init.values():
+            if not init.done():
+                init.cancel()
+        for task in self._bg_tasks:
+            task.cancel()
+        await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        
+        # Cleanup tools concurrently
+        for tool_name, error in await self._run_tool_cleanups():
+            self.logger.error(f"Error cleaning up {tool_name}: {error}")
         
         self.logger.info("MCP server cleanup complete")
     
+    async def _open_stdin(self, loop: asyncio.AbstractEventLoop) -> Tuple[Callable[[], Awaitable[bytes]], Callable[[], None]]:
+        """Return (readline, close) for stdin, reading on the event loop when possible"""
+        try:
+            # Only attach pipes and sockets (how MCP clients spawn us); files and
+            # devices such as /dev/null cannot be polled, and uvloop aborts on them
+            mode = os.fstat(sys.stdin.fileno()).st_mode
+            if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+                raise ValueError("stdin is not a pipe or socket")
+            
+            reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+            transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+            )
+            return reader.readline, transport.close
+        except (ValueError, OSError, NotImplementedError) as e:
+            # Fall back to blocking reads on one dedicated thread (also Windows loops)
+            self.logger.debug("stdin pipe reader unavailable (%s), using a reader thread", e)
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-stdin")
+            
+            def readline() -> Awaitable[bytes]:
+                return loop.run_in_executor(executor, sys.stdin.buffer.readline)
+            
+            return readline, lambda: executor.shutdown(wait=False)
+    
     async def run(self):
         """Run the MCP server using stdio"""
         # Initialize the server
         await self.initialize()
         
+        # Requests run as tasks so a slow tool call does not hold up reading the
+        # next line; the semaphore stops reading once the limit is in flight
+        call_sem = asyncio.Semaphore(self._max_concurrent_calls)
+        in_flight: set[asyncio.Task] = set()
+        loop = self._loop
+        
+        # Responses finished in the same loop iteration go out in one write + flush
+        pending_out: List[bytes] = []
+        stdout = sys.stdout.buffer
+        
+        def flush_out():
+            if pending_out:
+                stdout.write(b"".join(pending_out))
+                pending_out.clear()
+                stdout.flush()
+        
+        def send(response: Dict[str, Any]):
+            if not pending_out:
+                loop.call_soon(flush_out)
+            pending_out.append(orjson.dumps(response, option=orjson.OPT_APPEND_NEWLINE))
+        
+        async def serve(request: Dict[str, Any]):
+            try:
+                # Queue response
+                send(await self.handle_request(request))
+            finally:
+                call_sem.release()
+        
+        readline, close_stdin = await self._open_stdin(loop)
+        
         # Read from stdin and write to stdout
         while True:
             try:
                 # Read line from stdin
-                line = await asyncio.get_event_loop().run_in_executor(None, input)
+                line = await readline()
                 
+                if not line:
+                    break
                 if not line.strip():
                     continue
                 
                 # Parse JSON request
                 try:
-                    request = json.loads(line)
-                except json.JSONDecodeError as e:
+                    request = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
                     self.logger.error(f"Invalid JSON: {e}")
                     continue
                 
-                # Handle request
-                response = await self.handle_request(request)
+                # Anything but a JSON object cannot carry a method or id
+                if type(request) is not dict:
+                    send(self._create_error_response(None, -32600, "Invalid Request"))
+                    continue
                 
-                # Send response
-                print(json.dumps(response))
-                sys.stdout.flush()
+                # Handle request
+                await call_sem.acquire()
+                task = loop.create_task(serve(request))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
                 
             except EOFError:
                 break
@@ -457,6 +841,12 @@ class SimpleMCPServer:
                 self.logger.error(f"Error in MCP server loop: {e}")
                 break
         
+        # Let requests already read finish before tearing the tools down
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        flush_out()
+        close_stdin()
+        
         await self.cleanup()
 
 
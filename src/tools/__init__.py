@@ -2,13 +2,29 @@
 Tool definitions for Unraid MCP Server
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Protocol, runtime_checkable
 
 
 class Tool:
     """Simple Tool class to replace MCP framework dependency"""
     
+    __slots__ = ("name", "description", "inputSchema")
+    
     def __init__(self, name: str, description: str, inputSchema: Optional[Dict[str, Any]] = None):
         self.name = name
         self.description = description
-        self.inputSchema = inputSchema or {} 
\ No newline at end of file
+        self.inputSchema = inputSchema or {}
+
+
+@runtime_checkable
+class SupportsHealthCheck(Protocol):
+    """Tool module that can report its own health"""
+    
+    async def health_check(self) -> Dict[str, Any]: ...
+
+
+@runtime_checkable
+class SupportsCleanup(Protocol):
+    """Tool module that holds resources needing periodic/shutdown cleanup"""
+    
+    async def cleanup(self) -> None: ...
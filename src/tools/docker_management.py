@@ -3,16 +3,86 @@ Docker Management Tools for Unraid MCP Server
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Awaitable, Callable, Optional, Tuple, TypeVar
+from datetime import datetime
 import docker
+import orjson
 from docker.errors import DockerException
-import psutil
+from docker.utils import version_gte
 
+from utils.event_loop import run_in_executor
 from . import Tool
 
+# C ISO-8601 parser when available; fromisoformat accepts a trailing "Z" itself on 3.11+
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    parse_iso_datetime = datetime.fromisoformat
+
+T = TypeVar("T")
+
+# Docker API requests a single tool call keeps in flight at once
+MAX_CONCURRENT_DOCKER_CALLS = 16
+
+# Threads running blocking docker SDK calls; they mostly wait on the socket
+DOCKER_WORKERS = min(32, 4 * (os.cpu_count() or 1))
+
+# Seconds read-only results are reused; any mutating call clears them
+HEALTH_CHECK_TTL = 5
+LIST_CONTAINERS_TTL = 2
+ALL_STATS_TTL = 1
+
+# Marks a tool argument without a default in METHODS
+REQUIRED = object()
+
+# Tool method -> (handler attribute, ((argument, default), ...), changes Docker state)
+METHODS = {
+    "health_check": ("_cached_health_check", (), False),
+    "list_containers": ("_cached_list_containers", (("all", False), ("filters", {})), False),
+    "manage_container": ("_manage_container", (("action", REQUIRED), ("container_id", REQUIRED), ("force", False)), True),
+    "get_container_stats": ("_cached_container_stats", (("container_id", None), ("stream", False)), False),
+    "get_container_logs": ("_get_container_logs", (
+        ("container_id", REQUIRED), ("tail", 100), ("since", None), ("until", None), ("follow", False)
+    ), False),
+    "cleanup_docker": ("_cleanup_docker", (
+        ("remove_images", True), ("remove_volumes", False), ("remove_networks", True), ("prune_containers", True)
+    ), True),
+    "update_containers": ("_update_containers", (("container_id", None), ("auto_restart", True)), True),
+}
+
+# Top-level stats fields _container_stats reads; blkio, pids, storage etc. are dropped on receipt
+STATS_FIELDS = ("cpu_stats", "precpu_stats", "memory_stats", "networks")
+
+# manage_container action -> (blocking call on the container, past tense for the message)
+CONTAINER_ACTIONS: Dict[str, Tuple[Callable[[Any, bool], Any], str]] = {
+    "start": (lambda container, force: container.start(), "started"),
+    "stop": (lambda container, force: container.stop(timeout=0 if force else 30), "stopped"),
+    "restart": (lambda container, force: container.restart(timeout=30), "restarted"),
+    "pause": (lambda container, force: container.pause(), "paused"),
+    "unpause": (lambda container, force: container.unpause(), "unpaused"),
+    "remove": (lambda container, force: container.remove(force=force), "removed"),
+}
+
+# Samples read per container for get_container_stats(stream=True); the daemon sends about one a second
+STATS_STREAM_SAMPLES = 5
+
+# Longest a follow=True log request keeps the stream open waiting for new lines
+LOG_FOLLOW_SECONDS = 10
+
+
+def _append_log_entry(entries: List[Dict[str, str]], buf: bytes, start: int, end: int):
+    """Split buf[start:end] ("<timestamp> <message>") into a log entry; lines without both are skipped"""
+    space = buf.find(b" ", start, end)
+    if space > start:
+        entries.append({
+            "timestamp": buf[start:space].decode("ascii", "replace"),
+            "message": buf[space + 1:end].decode("utf-8", "replace")
+        })
+
 
 class DockerManagement:
     """Docker container management and monitoring tools"""
@@ -23,15 +93,67 @@ class DockerManagement:
         self.docker_client = None
         self.socket_path = config.get("socket_path", "/var/run/docker.sock")
         self.is_available = False
+        self._call_slots = asyncio.Semaphore(MAX_CONCURRENT_DOCKER_CALLS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # One-shot stats (API 1.41+) skip the daemon's ~1s second sample once a container has
+        # a previous snapshot to take CPU % against: id -> (total_usage, system_cpu_usage)
+        self._one_shot_stats = False
+        self._prev_cpu: Dict[str, Tuple[int, int]] = {}
+        
+        # Short-lived read-only results: key -> (expires at, result)
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Bumped on every invalidation; a fetch only stores its result if it is unchanged
+        self._cache_generation = 0
+        
+        self._tool_defs: Optional[List[Tool]] = None
+        
+        # METHODS with handlers bound once
+        self._handlers = {
+            method: (getattr(self, attr), arg_spec, mutating)
+            for method, (attr, arg_spec, mutating) in METHODS.items()
+        }
+    
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking docker SDK call on the module's own thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=DOCKER_WORKERS, thread_name_prefix="docker")
+        return await run_in_executor(self._executor, func, *args, **kwargs)
+        
+    async def _cached(self, key: str, ttl: float,
+                      fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Return a recent successful result for key, fetching it when missing or expired"""
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
         
+        # A mutation that starts or finishes while fetching may make the result stale
+        generation = self._cache_generation
+        result = await fetch()
+        if result.get("status") == "success" and generation == self._cache_generation:
+            self._cache[key] = (time.monotonic() + ttl, result)
+        return result
+    
+    def _invalidate_cache(self):
+        """Drop cached results and keep any fetch already in flight from storing its own"""
+        self._cache.clear()
+        self._cache_generation += 1
+    
     async def initialize(self):
         """Initialize the Docker management module"""
         self.logger.info("Initializing Docker Management module")
         
         try:
-            self.docker_client = docker.DockerClient(base_url=f"unix://{self.socket_path}")
+            # One long-lived client; its socket pool matches the worker pool so concurrent
+            # calls reuse connections instead of opening (and discarding) extras
+            self.docker_client = await self._run(
+                docker.DockerClient,
+                base_url=f"unix://{self.socket_path}",
+                max_pool_size=DOCKER_WORKERS
+            )
             # Test connection
-            self.docker_client.ping()
+            await self._run(self.docker_client.ping)
+            self._one_shot_stats = version_gte(self.docker_client.api.api_version, "1.41")
             self.is_available = True
             self.logger.info("Docker client initialized successfully")
         except DockerException as e:
@@ -44,155 +166,158 @@ class DockerManagement:
     
     async def get_tool_definitions(self) -> List[Tool]:
         """Return tool definitions for Docker management"""
-        return [
-            Tool(
-                name="health_check",
-                description="Check Docker daemon availability and connection status",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ),
-            Tool(
-                name="list_containers",
-                description="List all Docker containers with their status and basic information",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "all": {
-                            "type": "boolean",
-                            "description": "Include stopped containers",
-                            "default": False
-                        },
-                        "filters": {
-                            "type": "object",
-                            "description": "Filter containers by labels or other criteria"
-                        }
+        # Static, so built on first request and shared afterwards
+        if self._tool_defs is None:
+            self._tool_defs = [
+                Tool(
+                    name="health_check",
+                    description="Check Docker daemon availability and connection status",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {}
                     }
-                }
-            ),
-            Tool(
-                name="manage_container",
-                description="Start, stop, restart, or remove a Docker container",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "action": {
-                            "type": "string",
-                            "enum": ["start", "stop", "restart", "remove", "pause", "unpause"],
-                            "description": "Action to perform on the container"
-                        },
-                        "container_id": {
-                            "type": "string",
-                            "description": "Container ID or name"
-                        },
-                        "force": {
-                            "type": "boolean",
-                            "description": "Force the action (for stop/remove)",
-                            "default": False
-                        }
-                    },
-                    "required": ["action", "container_id"]
-                }
-            ),
-            Tool(
-                name="get_container_stats",
-                description="Get real-time resource usage statistics for containers",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "container_id": {
-                            "type": "string",
-                            "description": "Container ID or name (optional, returns all if not specified)"
-                        },
-                        "stream": {
-                            "type": "boolean",
-                            "description": "Stream real-time stats",
-                            "default": False
+                ),
+                Tool(
+                    name="list_containers",
+                    description="List all Docker containers with their status and basic information",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "all": {
+                                "type": "boolean",
+                                "description": "Include stopped containers",
+                                "default": False
+                            },
+                            "filters": {
+                                "type": "object",
+                                "description": "Filter containers by labels or other criteria"
+                            }
                         }
                     }
-                }
-            ),
-            Tool(
-                name="get_container_logs",
-                description="Get container logs with filtering and analysis",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "container_id": {
-                            "type": "string",
-                            "description": "Container ID or name"
-                        },
-                        "tail": {
-                            "type": "integer",
-                            "description": "Number of lines to return",
-                            "default": 100
-                        },
-                        "since": {
-                            "type": "string",
-                            "description": "Show logs since timestamp (ISO format)"
-                        },
-                        "until": {
-                            "type": "string",
-                            "description": "Show logs before timestamp (ISO format)"
+                ),
+                Tool(
+                    name="manage_container",
+                    description="Start, stop, restart, or remove a Docker container",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "action": {
+                                "type": "string",
+                                "enum": ["start", "stop", "restart", "remove", "pause", "unpause"],
+                                "description": "Action to perform on the container"
+                            },
+                            "container_id": {
+                                "type": "string",
+                                "description": "Container ID or name"
+                            },
+                            "force": {
+                                "type": "boolean",
+                                "description": "Force the action (for stop/remove)",
+                                "default": False
+                            }
                         },
-                        "follow": {
-                            "type": "boolean",
-                            "description": "Follow log output",
-                            "default": False
+                        "required": ["action", "container_id"]
+                    }
+                ),
+                Tool(
+                    name="get_container_stats",
+                    description="Get real-time resource usage statistics for containers",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "container_id": {
+                                "type": "string",
+                                "description": "Container ID or name (optional, returns all if not specified)"
+                            },
+                            "stream": {
+                                "type": "boolean",
+                                "description": "Stream real-time stats",
+                                "default": False
+                            }
                         }
-                    },
-                    "required": ["container_id"]
-                }
-            ),
-            Tool(
-                name="cleanup_docker",
-                description="Clean up unused Docker resources (images, volumes, networks)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "remove_images": {
-                            "type": "boolean",
-                            "description": "Remove unused images",
-                            "default": True
-                        },
-                        "remove_volumes": {
-                            "type": "boolean",
-                            "description": "Remove unused volumes",
-                            "default": False
-                        },
-                        "remove_networks": {
-                            "type": "boolean",
-                            "description": "Remove unused networks",
-                            "default": True
+                    }
+                ),
+                Tool(
+                    name="get_container_logs",
+                    description="Get container logs with filtering and analysis",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "container_id": {
+                                "type": "string",
+                                "description": "Container ID or name"
+                            },
+                            "tail": {
+                                "type": "integer",
+                                "description": "Number of lines to return",
+                                "default": 100
+                            },
+                            "since": {
+                                "type": "string",
+                                "description": "Show logs since timestamp (ISO format)"
+                            },
+                            "until": {
+                                "type": "string",
+                                "description": "Show logs before timestamp (ISO format)"
+                            },
+                            "follow": {
+                                "type": "boolean",
+                                "description": "Follow log output",
+                                "default": False
+                            }
                         },
-                        "prune_containers": {
-                            "type": "boolean",
-                            "description": "Remove stopped containers",
-                            "default": True
+                        "required": ["container_id"]
+                    }
+                ),
+                Tool(
+                    name="cleanup_docker",
+                    description="Clean up unused Docker resources (images, volumes, networks)",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "remove_images": {
+                                "type": "boolean",
+                                "description": "Remove unused images",
+                                "default": True
+                            },
+                            "remove_volumes": {
+                                "type": "boolean",
+                                "description": "Remove unused volumes",
+                                "default": False
+                            },
+                            "remove_networks": {
+                                "type": "boolean",
+                                "description": "Remove unused networks",
+                                "default": True
+                            },
+                            "prune_containers": {
+                                "type": "boolean",
+                                "description": "Remove stopped containers",
+                                "default": True
+                            }
                         }
                     }
-                }
-            ),
-            Tool(
-                name="update_containers",
-                description="Check for and apply container updates",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "container_id": {
-                            "type": "string",
-                            "description": "Specific container to update (optional)"
-                        },
-                        "auto_restart": {
-                            "type": "boolean",
-                            "description": "Automatically restart containers after update",
-                            "default": True
+                ),
+                Tool(
+                    name="update_containers",
+                    description="Check for and apply container updates",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "container_id": {
+                                "type": "string",
+                                "description": "Specific container to update (optional)"
+                            },
+                            "auto_restart": {
+                                "type": "boolean",
+                                "description": "Automatically restart containers after update",
+                                "default": True
+                            }
                         }
                     }
-                }
-            )
-        ]
+                )
+            ]
+        return self._tool_defs
     
     async def handle_call(self, method: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tool calls"""
@@ -206,51 +331,52 @@ class DockerManagement:
                     "timestamp": datetime.now().isoformat()
                 }
             
-            if method == "health_check":
-                return await self._health_check()
-            elif method == "list_containers":
-                return await self._list_containers(
-                    arguments.get("all", False),
-                    arguments.get("filters", {})
-                )
-            elif method == "manage_container":
-                return await self._manage_container(
-                    arguments["action"],
-                    arguments["container_id"],
-                    arguments.get("force", False)
-                )
-            elif method == "get_container_stats":
-                return await self._get_container_stats(
-                    arguments.get("container_id"),
-                    arguments.get("stream", False)
-                )
-            elif method == "get_container_logs":
-                return await self._get_container_logs(
-                    arguments["container_id"],
-                    arguments.get("tail", 100),
-                    arguments.get("since"),
-                    arguments.get("until"),
-                    arguments.get("follow", False)
-                )
-            elif method == "cleanup_docker":
-                return await self._cleanup_docker(
-                    arguments.get("remove_images", True),
-                    arguments.get("remove_volumes", False),
-                    arguments.get("remove_networks", True),
-                    arguments.get("prune_containers", True)
-                )
-            elif method == "update_containers":
-                return await self._update_containers(
-                    arguments.get("container_id"),
-                    arguments.get("auto_restart", True)
-                )
-            else:
+            handler, arg_spec, mutating = self._handlers.get(method) or (None, (), False)
+            if handler is None:
                 raise ValueError(f"Unknown method: {method}")
+            
+            # Required arguments (no default) raise KeyError like a direct lookup
+            args = [
+                arguments[name] if default is REQUIRED else arguments.get(name, default)
+                for name, default in arg_spec
+            ]
+            if not mutating:
+                return await handler(*args)
+            
+            # Invalidate around the mutation, so reads that overlap it are not cached
+            self._invalidate_cache()
+            try:
+                return await handler(*args)
+            finally:
+                self._invalidate_cache()
                 
         except Exception as e:
             self.logger.error(f"Error in {method}: {e}", exc_info=True)
             return {"error": str(e), "method": method}
     
+    async def _cached_health_check(self) -> Dict[str, Any]:
+        return await self._cached("health_check", HEALTH_CHECK_TTL, self._health_check)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Server health hook: daemon reachability, without timestamps so repeats compare equal"""
+        result = await self._cached_health_check()
+        data = result["data"]
+        health = {"status": result["status"], "docker_available": data["docker_available"]}
+        error = data.get("error") or data.get("message")
+        if error:
+            health["error"] = error
+        return health
+    
+    async def _cached_list_containers(self, all_containers: bool, filters: Dict) -> Dict[str, Any]:
+        key = "list_containers:" + orjson.dumps([all_containers, filters], option=orjson.OPT_SORT_KEYS).decode()
+        return await self._cached(key, LIST_CONTAINERS_TTL, lambda: self._list_containers(all_containers, filters))
+    
+    async def _cached_container_stats(self, container_id: Optional[str], stream: bool) -> Dict[str, Any]:
+        # Only the all-containers snapshot is shared
+        if container_id or stream:
+            return await self._get_container_stats(container_id, stream)
+        return await self._cached("container_stats", ALL_STATS_TTL, lambda: self._get_container_stats(None, stream))
+    
     async def _health_check(self) -> Dict[str, Any]:
         """Check Docker daemon health and availability"""
         try:
@@ -266,8 +392,10 @@ class DockerManagement:
                 }
             
             # Test connection
-            info = self.docker_client.info()
-            version = self.docker_client.version()
+            info, version = await asyncio.gather(
+                self._run(self.docker_client.info),
+                self._run(self.docker_client.version)
+            )
             
             return {
                 "status": "success",
@@ -303,21 +431,42 @@ class DockerManagement:
     async def _list_containers(self, all_containers: bool = False, filters: Dict = None) -> Dict[str, Any]:
         """List Docker containers"""
         try:
-            containers = self.docker_client.containers.list(all=all_containers, filters=filters or {})
-            
-            container_list = []
-            for container in containers:
-                container_info = {
-                    "id": container.id,
-                    "name": container.name,
-                    "status": container.status,
-                    "image": container.image.tags[0] if container.image.tags else container.image.id,
-                    "created": container.attrs["Created"],
-                    "ports": container.attrs["NetworkSettings"]["Ports"],
-                    "labels": container.labels,
-                    "state": container.attrs["State"]
+            # Same requests as containers.list() and container.image, but the per-container
+            # inspects run concurrently and each distinct image is looked up once
+            api = self.docker_client.api
+            summaries = await self._run(api.containers, all=all_containers, filters=filters, quiet=True)
+            
+            async def inspect(func: Callable[[str], Dict[str, Any]], resource_id: str) -> Dict[str, Any]:
+                async with self._call_slots:
+                    return await self._run(func, resource_id)
+            
+            details = await asyncio.gather(*(inspect(api.inspect_container, summary["Id"]) for summary in summaries))
+            
+            image_ids = list({attrs["Image"] for attrs in details})
+            images = await asyncio.gather(
+                *(inspect(api.inspect_image, image_id) for image_id in image_ids), return_exceptions=True
+            )
+            image_names = {}
+            for image_id, image in zip(image_ids, images):
+                # Image.tags leaves out the "<none>:<none>" placeholder
+                tags = [] if isinstance(image, Exception) else [
+                    tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"
+                ]
+                image_names[image_id] = tags[0] if tags else image_id
+            
+            container_list = [
+                {
+                    "id": attrs["Id"],
+                    "name": attrs["Name"].lstrip("/"),
+                    "status": attrs["State"]["Status"],
+                    "image": image_names[attrs["Image"]],
+                    "created": attrs["Created"],
+                    "ports": attrs["NetworkSettings"]["Ports"],
+                    "labels": attrs["Config"].get("Labels") or {},
+                    "state": attrs["State"]
                 }
-                container_list.append(container_info)
+                for attrs in details
+            ]
             
             return {
                 "status": "success",
@@ -334,28 +483,14 @@ class DockerManagement:
     async def _manage_container(self, action: str, container_id: str, force: bool = False) -> Dict[str, Any]:
         """Manage container lifecycle"""
         try:
-            container = self.docker_client.containers.get(container_id)
-            
-            if action == "start":
-                container.start()
-                message = f"Container {container_id} started successfully"
-            elif action == "stop":
-                container.stop(timeout=30 if not force else 0)
-                message = f"Container {container_id} stopped successfully"
-            elif action == "restart":
-                container.restart(timeout=30)
-                message = f"Container {container_id} restarted successfully"
-            elif action == "pause":
-                container.pause()
-                message = f"Container {container_id} paused successfully"
-            elif action == "unpause":
-                container.unpause()
-                message = f"Container {container_id} unpaused successfully"
-            elif action == "remove":
-                container.remove(force=force)
-                message = f"Container {container_id} removed successfully"
-            else:
-                raise ValueError(f"Invalid action: {action}")
+            operation = CONTAINER_ACTIONS.get(action)
+            if operation is None:
+                raise ValueError(f"Invalid action: {action} (expected one of: {', '.join(CONTAINER_ACTIONS)})")
+            apply, done = operation
+            
+            container = await self._run(self.docker_client.containers.get, container_id)
+            await self._run(apply, container, force)
+            message = f"Container {container_id} {done} successfully"
             
             return {
                 "status": "success",
@@ -370,58 +505,136 @@ class DockerManagement:
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    def _get_stats(self, container_id: str, one_shot: bool = False) -> Dict[str, Any]:
+        """Single stats snapshot (blocking); one_shot skips the daemon's second sample"""
+        # docker-py decodes the non-stream reply with stdlib json itself; only the
+        # streaming path in _stream_stats hands back raw bytes for orjson
+        stats = self.docker_client.api.stats(container_id, stream=False, one_shot=True if one_shot else None)
+        return {field: stats[field] for field in STATS_FIELDS if field in stats}
+    
+    def _stream_stats(self, container_id: str, count: int) -> List[Dict[str, Any]]:
+        """Read count consecutive samples from one stats stream, then close it (blocking)"""
+        stream = self.docker_client.api.stats(container_id, stream=True, decode=False)
+        try:
+            # One JSON document per line, roughly one per second; HTTP chunks need not
+            # end on a line, so complete lines are split off a running buffer
+            samples = []
+            pending = b""
+            for chunk in stream:
+                # A non-chunked reply arrives whole, already decoded to text
+                pending += chunk.encode() if isinstance(chunk, str) else chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    stats = orjson.loads(line)
+                    samples.append({field: stats[field] for field in STATS_FIELDS if field in stats})
+                    if len(samples) >= count:
+                        return samples
+            return samples
+        finally:
+            # The generator holds the only reference to the streaming response; closing it
+            # releases the response, which closes the connection and ends the daemon's stream
+            stream.close()
+    
+    async def _container_stats(self, container: Any, stream: bool = False) -> Dict[str, Any]:
+        """Resource usage summary for one container; with stream, over several samples"""
+        try:
+            async with self._call_slots:
+                if stream:
+                    samples = await self._run(self._stream_stats, container.id, STATS_STREAM_SAMPLES)
+                else:
+                    # The first read of a container lets the daemon take its own precpu
+                    # sample so CPU % is known; later ones are one-shot against ours
+                    one_shot = self._one_shot_stats and container.id in self._prev_cpu
+                    samples = [await self._run(self._get_stats, container.id, one_shot)]
+            if not samples:
+                raise ValueError("stats stream ended without data")
+            
+            summaries = [self._summarize_stats(container, stats) for stats in samples]
+            summary = summaries[-1]
+            if stream:
+                summary["samples"] = [
+                    {"cpu_percent": sample["cpu_percent"], "memory_usage_mb": sample["memory_usage_mb"]}
+                    for sample in summaries
+                ]
+            return summary
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _summarize_stats(self, container: Any, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn one stats sample into the reported summary"""
+        # Calculate CPU usage against the daemon's own previous sample when it took one,
+        # otherwise against ours from the container's previous call
+        cpu_stats = stats["cpu_stats"]
+        total_usage = cpu_stats["cpu_usage"]["total_usage"]
+        system_usage = cpu_stats.get("system_cpu_usage", 0)
+        precpu = stats.get("precpu_stats") or {}
+        if precpu.get("system_cpu_usage"):
+            previous = (precpu["cpu_usage"]["total_usage"], precpu["system_cpu_usage"])
+        else:
+            previous = self._prev_cpu.get(container.id)
+        self._prev_cpu[container.id] = (total_usage, system_usage)
+        
+        cpu_percent = None
+        if previous is not None and system_usage > previous[1]:
+            online_cpus = cpu_stats.get("online_cpus") or len(cpu_stats["cpu_usage"].get("percpu_usage") or ()) or os.cpu_count() or 1
+            cpu_percent = round((total_usage - previous[0]) / (system_usage - previous[1]) * online_cpus * 100, 2)
+        
+        # Memory usage (stopped containers report an empty memory_stats)
+        memory_stats = stats.get("memory_stats") or {}
+        memory_usage = memory_stats.get("usage", 0)
+        memory_limit = memory_stats.get("limit", 0)
+        memory_percent = (memory_usage / memory_limit) * 100 if memory_limit > 0 else 0
+        
+        # Network stats
+        network_stats = {}
+        for interface, data in (stats.get("networks") or {}).items():
+            network_stats[interface] = {
+                "rx_bytes": data["rx_bytes"],
+                "tx_bytes": data["tx_bytes"],
+                "rx_packets": data["rx_packets"],
+                "tx_packets": data["tx_packets"]
+            }
+        
+        return {
+            "name": container.name,
+            "cpu_percent": cpu_percent,
+            "memory_usage_mb": round(memory_usage / (1024 * 1024), 2),
+            "memory_limit_mb": round(memory_limit / (1024 * 1024), 2),
+            "memory_percent": round(memory_percent, 2),
+            "network_stats": network_stats
+        }
+    
     async def _get_container_stats(self, container_id: Optional[str] = None, stream: bool = False) -> Dict[str, Any]:
         """Get container resource statistics"""
         try:
             if container_id:
-                containers = [self.docker_client.containers.get(container_id)]
+                containers = [await self._run(self.docker_client.containers.get, container_id)]
             else:
-                containers = self.docker_client.containers.list()
+                containers = await self._run(self.docker_client.containers.list)
+            
+            # One stats request per container, all in flight at once (bounded by the semaphore)
+            results = await asyncio.gather(*(self._container_stats(container, stream) for container in containers))
             
+            # Samples land together, so one timestamp serves every entry and the response
+            timestamp = datetime.now().isoformat()
             stats_data = {}
+            for container, info in zip(containers, results):
+                if "error" not in info:
+                    info["timestamp"] = timestamp
+                stats_data[container.id] = info
             
-            for container in containers:
-                try:
-                    stats = container.stats(stream=False)
-                    
-                    # Calculate CPU usage
-                    cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-                    system_delta = stats["cpu_stats"]["system_cpu_usage"] - stats["precpu_stats"]["system_cpu_usage"]
-                    cpu_percent = (cpu_delta / system_delta) * len(stats["cpu_stats"]["cpu_usage"]["percpu_usage"]) * 100
-                    
-                    # Memory usage
-                    memory_usage = stats["memory_stats"]["usage"]
-                    memory_limit = stats["memory_stats"]["limit"]
-                    memory_percent = (memory_usage / memory_limit) * 100 if memory_limit > 0 else 0
-                    
-                    # Network stats
-                    network_stats = {}
-                    if "networks" in stats["networks"]:
-                        for interface, data in stats["networks"].items():
-                            network_stats[interface] = {
-                                "rx_bytes": data["rx_bytes"],
-                                "tx_bytes": data["tx_bytes"],
-                                "rx_packets": data["rx_packets"],
-                                "tx_packets": data["tx_packets"]
-                            }
-                    
-                    stats_data[container.id] = {
-                        "name": container.name,
-                        "cpu_percent": round(cpu_percent, 2),
-                        "memory_usage_mb": round(memory_usage / (1024 * 1024), 2),
-                        "memory_limit_mb": round(memory_limit / (1024 * 1024), 2),
-                        "memory_percent": round(memory_percent, 2),
-                        "network_stats": network_stats,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    
-                except Exception as e:
-                    stats_data[container.id] = {"error": str(e)}
+            # Forget CPU snapshots of containers that are gone
+            if not container_id:
+                for gone in self._prev_cpu.keys() - stats_data.keys():
+                    del self._prev_cpu[gone]
             
             return {
                 "status": "success",
                 "data": {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "stats": stats_data
                 }
             }
@@ -433,36 +646,31 @@ class DockerManagement:
                                  until: Optional[str] = None, follow: bool = False) -> Dict[str, Any]:
         """Get container logs"""
         try:
-            container = self.docker_client.containers.get(container_id)
+            container = await self._run(self.docker_client.containers.get, container_id)
             
             # Parse timestamps
-            since_time = None
-            until_time = None
-            if since:
-                since_time = datetime.fromisoformat(since.replace('Z', '+00:00'))
-            if until:
-                until_time = datetime.fromisoformat(until.replace('Z', '+00:00'))
-            
-            logs = container.logs(
+            since_time = parse_iso_datetime(since) if since else None
+            until_time = parse_iso_datetime(until) if until else None
+            
+            stream = await self._run(
+                container.logs,
+                stream=True,
                 tail=tail,
                 since=since_time,
                 until=until_time,
                 follow=follow,
                 timestamps=True
-            ).decode('utf-8')
-            
-            # Parse logs into structured format
-            log_entries = []
-            for line in logs.strip().split('\n'):
-                if line:
-                    # Parse timestamp and message
-                    parts = line.split(' ', 1)
-                    if len(parts) == 2:
-                        timestamp, message = parts
-                        log_entries.append({
-                            "timestamp": timestamp,
-                            "message": message
-                        })
+            )
+            
+            # A followed stream never ends on its own; closing it from here ends the read
+            close_handle = None
+            if follow:
+                close_handle = asyncio.get_running_loop().call_later(LOG_FOLLOW_SECONDS, stream.close)
+            try:
+                log_entries = await self._run(self._read_log_entries, stream, tail)
+            finally:
+                if close_handle is not None:
+                    close_handle.cancel()
             
             return {
                 "status": "success",
@@ -478,6 +686,34 @@ class DockerManagement:
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    @staticmethod
+    def _read_log_entries(stream: Any, limit: int) -> List[Dict[str, str]]:
+        """Parse at most limit timestamped lines from a log stream, then close it (blocking)"""
+        entries: List[Dict[str, str]] = []
+        buf = b""
+        try:
+            for chunk in stream:
+                buf = buf + chunk if buf else chunk
+                
+                # Walk complete lines in place; only the unfinished tail is carried over
+                start = 0
+                while len(entries) < limit:
+                    end = buf.find(b"\n", start)
+                    if end < 0:
+                        break
+                    _append_log_entry(entries, buf, start, end)
+                    start = end + 1
+                buf = buf[start:]
+                
+                if len(entries) >= limit:
+                    break
+        finally:
+            stream.close()
+        
+        if buf and len(entries) < limit:
+            _append_log_entry(entries, buf, 0, len(buf))
+        return entries
+    
     async def _cleanup_docker(self, remove_images: bool = True, remove_volumes: bool = False,
                              remove_networks: bool = True, prune_containers: bool = True) -> Dict[str, Any]:
         """Clean up unused Docker resources"""
@@ -491,40 +727,29 @@ class DockerManagement:
                 "freed_space_mb": 0
             }
             
-            # Remove stopped containers
-            if prune_containers:
+            async def prune(label: str, prune_fn: Callable[[], Dict[str, Any]], deleted_key: str, result_key: str):
                 try:
-                    result = self.docker_client.containers.prune()
-                    cleanup_results["removed_containers"] = len(result["ContainersDeleted"])
-                    cleanup_results["freed_space_mb"] += result["SpaceReclaimed"] / (1024 * 1024)
+                    result = await self._run(prune_fn)
                 except Exception as e:
-                    self.logger.warning(f"Failed to prune containers: {e}")
+                    self.logger.warning(f"Failed to prune {label}: {e}")
+                    return
+                cleanup_results[result_key] = len(result.get(deleted_key) or ())
+                cleanup_results["freed_space_mb"] += (result.get("SpaceReclaimed") or 0) / (1024 * 1024)
             
-            # Remove unused images
-            if remove_images:
-                try:
-                    result = self.docker_client.images.prune()
-                    cleanup_results["removed_images"] = len(result["ImagesDeleted"])
-                    cleanup_results["freed_space_mb"] += result["SpaceReclaimed"] / (1024 * 1024)
-                except Exception as e:
-                    self.logger.warning(f"Failed to prune images: {e}")
+            # Remove stopped containers first: images, volumes and networks they
+            # still reference only become prunable once they are gone
+            if prune_containers:
+                await prune("containers", self.docker_client.containers.prune, "ContainersDeleted", "removed_containers")
             
-            # Remove unused volumes
+            # The remaining prunes are independent of each other
+            prunes = []
+            if remove_images:
+                prunes.append(prune("images", self.docker_client.images.prune, "ImagesDeleted", "removed_images"))
             if remove_volumes:
-                try:
-                    result = self.docker_client.volumes.prune()
-                    cleanup_results["removed_volumes"] = len(result["VolumesDeleted"])
-                    cleanup_results["freed_space_mb"] += result["SpaceReclaimed"] / (1024 * 1024)
-                except Exception as e:
-                    self.logger.warning(f"Failed to prune volumes: {e}")
-            
-            # Remove unused networks
+                prunes.append(prune("volumes", self.docker_client.volumes.prune, "VolumesDeleted", "removed_volumes"))
             if remove_networks:
-                try:
-                    result = self.docker_client.networks.prune()
-                    cleanup_results["removed_networks"] = len(result["NetworksDeleted"])
-                except Exception as e:
-                    self.logger.warning(f"Failed to prune networks: {e}")
+                prunes.append(prune("networks", self.docker_client.networks.prune, "NetworksDeleted", "removed_networks"))
+            await asyncio.gather(*prunes)
             
             cleanup_results["freed_space_mb"] = round(cleanup_results["freed_space_mb"], 2)
             
@@ -536,6 +761,56 @@ class DockerManagement:
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    @staticmethod
+    def _image_ref(container: Any) -> Tuple[Any, Tuple[str, str]]:
+        """A container's current image and the (repo, tag) to pull for it (blocking)"""
+        # Get current image
+        current_image = container.image
+        
+        image_name = current_image.tags[0] if current_image.tags else current_image.id
+        if ':' in image_name:
+            repo, tag = image_name.rsplit(':', 1)
+        else:
+            repo, tag = image_name, 'latest'
+        return current_image, (repo, tag)
+    
+    def _recreate_container(self, container: Any, current_image: Any, new_image: Any,
+                            auto_restart: bool) -> Dict[str, Any]:
+        """Recreate a container from its freshly pulled image if the image changed (blocking)"""
+        # Check if image changed
+        if new_image.id == current_image.id:
+            return {
+                "container_name": container.name,
+                "image": current_image.id[:12],
+                "status": "up_to_date"
+            }
+        
+        # Stop container if running
+        was_running = container.status == "running"
+        if was_running:
+            container.stop(timeout=30)
+        
+        # Remove old container
+        container.remove()
+        
+        # Create new container with same configuration
+        # This is a simplified version - in practice, you'd need to recreate with all the original settings
+        new_container = self.docker_client.containers.run(
+            new_image.id,
+            detach=True,
+            name=container.name
+        )
+        
+        if was_running and auto_restart:
+            new_container.start()
+        
+        return {
+            "container_name": container.name,
+            "old_image": current_image.id[:12],
+            "new_image": new_image.id[:12],
+            "status": "updated"
+        }
+    
     async def _update_containers(self, container_id: Optional[str] = None, auto_restart: bool = True) -> Dict[str, Any]:
         """Check for and apply container updates"""
         try:
@@ -548,69 +823,43 @@ class DockerManagement:
             }
             
             if container_id:
-                containers = [self.docker_client.containers.get(container_id)]
+                containers = [await self._run(self.docker_client.containers.get, container_id)]
             else:
-                containers = self.docker_client.containers.list()
+                containers = await self._run(self.docker_client.containers.list)
             
-            for container in containers:
-                try:
-                    update_results["checked_containers"] += 1
-                    
-                    # Get current image
-                    current_image = container.image
-                    
-                    # Pull latest image
-                    image_name = current_image.tags[0] if current_image.tags else current_image.id
-                    if ':' in image_name:
-                        repo, tag = image_name.rsplit(':', 1)
-                    else:
-                        repo, tag = image_name, 'latest'
-                    
-                    # Pull the latest image
-                    new_image = self.docker_client.images.pull(repo, tag=tag)
-                    
-                    # Check if image changed
-                    if new_image.id != current_image.id:
-                        # Stop container if running
-                        was_running = container.status == "running"
-                        if was_running:
-                            container.stop(timeout=30)
-                        
-                        # Remove old container
-                        container.remove()
-                        
-                        # Create new container with same configuration
-                        # This is a simplified version - in practice, you'd need to recreate with all the original settings
-                        new_container = self.docker_client.containers.run(
-                            new_image.id,
-                            detach=True,
-                            name=container.name
-                        )
-                        
-                        if was_running and auto_restart:
-                            new_container.start()
-                        
-                        update_results["updated_containers"] += 1
-                        update_results["details"].append({
-                            "container_name": container.name,
-                            "old_image": current_image.id[:12],
-                            "new_image": new_image.id[:12],
-                            "status": "updated"
-                        })
-                    else:
-                        update_results["details"].append({
-                            "container_name": container.name,
-                            "image": current_image.id[:12],
-                            "status": "up_to_date"
-                        })
-                        
-                except Exception as e:
+            # Each distinct (repo, tag) is pulled once, however many containers run it
+            pulls: Dict[Tuple[str, str], asyncio.Task] = {}
+            
+            async def pull(ref: Tuple[str, str]) -> Any:
+                async with self._call_slots:
+                    return await self._run(self.docker_client.images.pull, ref[0], tag=ref[1])
+            
+            async def update_one(container: Any) -> Dict[str, Any]:
+                async with self._call_slots:
+                    current_image, ref = await self._run(self._image_ref, container)
+                
+                if ref not in pulls:
+                    pulls[ref] = asyncio.ensure_future(pull(ref))
+                new_image = await pulls[ref]
+                
+                async with self._call_slots:
+                    return await self._run(self._recreate_container, container, current_image, new_image, auto_restart)
+            
+            # Image pulls dominate, so check every container concurrently
+            results = await asyncio.gather(*(update_one(container) for container in containers), return_exceptions=True)
+            
+            for container, detail in zip(containers, results):
+                update_results["checked_containers"] += 1
+                if isinstance(detail, Exception):
                     update_results["failed_updates"] += 1
-                    update_results["details"].append({
+                    detail = {
                         "container_name": container.name,
                         "status": "failed",
-                        "error": str(e)
-                    })
+                        "error": str(detail)
+                    }
+                elif detail["status"] == "updated":
+                    update_results["updated_containers"] += 1
+                update_results["details"].append(detail)
             
             return {
                 "status": "success",
@@ -623,4 +872,9 @@ class DockerManagement:
     async def cleanup(self):
         """Cleanup resources"""
         if self.docker_client:
-            self.docker_client.close() 
\ No newline at end of file
+            self.docker_client.close()
+        
+        # Queued calls still finish; the pool is recreated if the module is used again
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None 
\ No newline at end of file
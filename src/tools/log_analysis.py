@@ -3,19 +3,246 @@ Log Analysis Tools for Unraid MCP Server
 """
 
 import asyncio
-import json
 import logging
-import re
 import os
-from typing import Dict, List, Any, Optional
+import re
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Dict, List, Any, Deque, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-import aiofiles
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 
+from utils.event_loop import to_thread
 from . import Tool
 
+# Linear-time RE2 engine for patterns sent by MCP clients, when available
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# get_error_summary categories, checked in order; the first that matches wins
+ERROR_CATEGORIES = tuple(
+    (category, re.compile(pattern, re.IGNORECASE))
+    for category, pattern in (
+        ("timeout", r"timeout"),
+        ("connection", r"connection"),
+        ("permission", r"permission"),
+        ("storage", r"disk|storage"),
+        ("memory", r"memory"),
+    )
+)
+WARNING_RE = re.compile(r"warning", re.IGNORECASE)
+# Memory budget for each RE2-compiled client pattern
+RE2_MAX_MEM = 64 << 20
+# Errors and warnings returned by analyze_system_logs, most recent last
+RECENT_LOG_ENTRIES = 500
+# Longest monitor_log_patterns waits for a file event before re-checking the logs
+MONITOR_POLL_SECONDS = 5
+# Initial tail read size per requested line; doubled until enough lines are found
+TAIL_BYTES_PER_LINE = 256
+# Common log formats (syslog, ISO 8601, simple timestamp) in one pattern; the
+# named group that matched tells the formats apart
+LOG_LINE_RE = re.compile(
+    r'(?:(?P<syslog_ts>\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'
+    r'|(?P<iso_ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2}))'
+    r'|(?P<simple_ts>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}))'
+    r'\s+(?P<host>\S+)\s+(?P<component>[^:]+):\s*(?P<message>.*)'
+)
+# Parsed fields are memoized per raw line: successive analyze, summary and report
+# calls re-read a log tail that has mostly not changed since the last call
+PARSE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_log_fields(line: str) -> Tuple[Optional[datetime], str, str, str]:
+    """Parse a log line into (timestamp, host, component, message)"""
+    match = LOG_LINE_RE.match(line)
+    if match:
+        # Parse timestamp; syslog stamps carry no year and stay None
+        timestamp = None
+        try:
+            if match["iso_ts"]:
+                timestamp = datetime.fromisoformat(match["iso_ts"].replace('Z', '+00:00'))
+            elif match["simple_ts"]:
+                timestamp = datetime.strptime(match["simple_ts"], '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            pass
+        
+        return timestamp, match["host"], match["component"], match["message"]
+    
+    # Fallback for unparseable lines
+    return None, "unknown", "unknown", line
+
+
+def _read_tail(log_path: str, max_lines: int) -> List[str]:
+    """Read the last max_lines lines of a file, seeking back from the end"""
+    if max_lines <= 0:
+        return []
+    fd = os.open(log_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        offset = size
+        data = b""
+        # Read backwards in growing chunks until there are enough lines or the
+        # start of the file is reached; the first line may be partial until then
+        chunk_size = TAIL_BYTES_PER_LINE * max_lines
+        while offset > 0 and data.count(b"\n") <= max_lines:
+            read_size = min(chunk_size, offset)
+            offset -= read_size
+            data = os.pread(fd, read_size, offset) + data
+            chunk_size *= 2
+    finally:
+        os.close(fd)
+    
+    lines = data.decode("utf-8", errors="ignore").splitlines()
+    if offset > 0:
+        lines = lines[1:]
+    return lines[-max_lines:]
+
+
+def _scan_one_file(file_path: str, max_lines: int, cutoff_time: datetime, error_re: re.Pattern,
+                   count_phrases: bool, count_error_types: bool) -> Tuple["_LogScan", Optional[str]]:
+    """Classify the tail of one log file; runs in a worker thread
+    
+    Returns the scan and the read error, if any, for the caller to log.
+    """
+    scan = _LogScan()
+    read_error = None
+    try:
+        lines = _read_tail(file_path, max_lines)
+    except Exception as e:
+        lines = []
+        read_error = str(e)
+    
+    file_analysis = {
+        "file": file_path,
+        "lines_analyzed": len(lines),
+        "errors": 0,
+        "warnings": 0
+    }
+    scan.total_lines = len(lines)
+    
+    for line in lines:
+        timestamp, _, component, message = _parse_log_fields(line)
+        
+        # Check if line is within time range
+        if timestamp and timestamp < cutoff_time:
+            continue
+        
+        # Check for errors and warnings
+        if error_re.search(message):
+            file_analysis["errors"] += 1
+            scan.errors.append((timestamp, component, message, file_path))
+            scan.error_components[component] += 1
+            if count_phrases:
+                _count_phrases(scan.error_phrases, message)
+            if count_error_types:
+                # Categorize errors
+                category = next(
+                    (name for name, category_re in ERROR_CATEGORIES if category_re.search(message)),
+                    "other"
+                )
+                scan.error_types[category] += 1
+        elif WARNING_RE.search(message):
+            file_analysis["warnings"] += 1
+            scan.warnings.append((timestamp, component, message, file_path))
+            scan.warning_components[component] += 1
+            if count_phrases:
+                _count_phrases(scan.warning_phrases, message)
+    
+    scan.error_count = file_analysis["errors"]
+    scan.warning_count = file_analysis["warnings"]
+    scan.files_analyzed.append(file_analysis)
+    return scan, read_error
+
+
+def _compile_client_pattern(pattern: str, ignore_case: bool = True):
+    """Compile a pattern from a tool call, with RE2 so a pathological pattern cannot backtrack
+    
+    Constructs RE2 does not support (backreferences, look-arounds) fall back to re.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        options.max_mem = RE2_MAX_MEM
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def _count_phrases(phrase_counts: Counter, message: str):
+    """Count the adjacent word pairs in a message, keyed by (word, word) tuple"""
+    words = message.split()
+    phrase_counts.update(zip(words, words[1:]))
+
+
+def _log_entry(timestamp: Optional[datetime], component: str, message: str, file_path: str) -> Dict[str, Any]:
+    """Format a scanned error or warning for a tool response"""
+    return {
+        "timestamp": timestamp.isoformat() if timestamp else None,
+        "component": component,
+        "message": message,
+        "file": file_path
+    }
+
+
+class _LogScan:
+    """Counts and recent entries gathered by one pass over the log files"""
+    
+    __slots__ = (
+        "files_analyzed", "total_lines", "error_count", "warning_count", "errors", "warnings",
+        "error_components", "warning_components", "error_phrases", "warning_phrases", "error_types"
+    )
+    
+    def __init__(self):
+        self.files_analyzed: List[Dict[str, Any]] = []
+        self.total_lines = 0
+        self.error_count = 0
+        self.warning_count = 0
+        # Only the most recent entries are kept; the counts and counters cover every line
+        self.errors: Deque[Tuple[Optional[datetime], str, str, str]] = deque(maxlen=RECENT_LOG_ENTRIES)
+        self.warnings: Deque[Tuple[Optional[datetime], str, str, str]] = deque(maxlen=RECENT_LOG_ENTRIES)
+        self.error_components: Counter = Counter()
+        self.warning_components: Counter = Counter()
+        self.error_phrases: Counter = Counter()
+        self.warning_phrases: Counter = Counter()
+        self.error_types: Counter = Counter()
+    
+    def merge(self, other: "_LogScan"):
+        """Append another file's scan, as if its lines had followed this one's"""
+        self.files_analyzed.extend(other.files_analyzed)
+        self.total_lines += other.total_lines
+        self.error_count += other.error_count
+        self.warning_count += other.warning_count
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.error_components.update(other.error_components)
+        self.warning_components.update(other.warning_components)
+        self.error_phrases.update(other.error_phrases)
+        self.warning_phrases.update(other.warning_phrases)
+        self.error_types.update(other.error_types)
+
+
+class _LogChangeHandler(FileSystemEventHandler):
+    """Wakes monitor_log_patterns when one of its log files changes"""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, changed: asyncio.Event, log_paths: List[str]):
+        self._loop = loop
+        self._changed = changed
+        self._log_paths = set(log_paths)
+    
+    def on_any_event(self, event):
+        # Called on the observer thread
+        if event.src_path in self._log_paths or getattr(event, "dest_path", None) in self._log_paths:
+            self._loop.call_soon_threadsafe(self._changed.set)
+
 
 class LogAnalysis:
     """Intelligent log analysis and monitoring tools"""
@@ -41,6 +268,12 @@ class LogAnalysis:
             r"permission denied"
         ])
         
+        # All error patterns in one case-insensitive alternation, searched once per message.
+        # Patterns are literal substrings of the lower-cased message, so they are escaped, and
+        # ones with upper-case letters (which could never match that) are left out
+        literals = [re.escape(pattern) for pattern in self.error_patterns if pattern == pattern.lower()]
+        self._error_re = re.compile("|".join(literals) if literals else r"(?!)", re.IGNORECASE)
+        
     async def initialize(self):
         """Initialize the log analysis module"""
         self.logger.info("Initializing Log Analysis module")
@@ -217,61 +450,19 @@ class LogAnalysis:
     async def _read_log_file(self, log_path: str, max_lines: int = None) -> List[str]:
         """Read log file and return lines"""
         try:
-            lines = []
-            max_lines = max_lines or self.max_lines
-            
-            async with aiofiles.open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                # Read last N lines efficiently
-                content = await f.read()
-                all_lines = content.splitlines()
-                lines = all_lines[-max_lines:] if len(all_lines) > max_lines else all_lines
-            
-            return lines
+            return await to_thread(_read_tail, log_path, max_lines or self.max_lines)
         except Exception as e:
             self.logger.error(f"Error reading log file {log_path}: {e}")
             return []
     
-    async def _parse_log_line(self, line: str) -> Dict[str, Any]:
+    def _parse_log_line(self, line: str) -> Dict[str, Any]:
         """Parse a log line into structured data"""
-        # Common log formats
-        patterns = [
-            # syslog format
-            r'^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:]+):\s*(.*)$',
-            # ISO format
-            r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2}))\s+(\S+)\s+([^:]+):\s*(.*)$',
-            # Simple timestamp format
-            r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:]+):\s*(.*)$'
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, line)
-            if match:
-                timestamp_str, host, component, message = match.groups()
-                
-                # Parse timestamp
-                timestamp = None
-                try:
-                    if 'T' in timestamp_str:
-                        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    else:
-                        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                except:
-                    pass
-                
-                return {
-                    "timestamp": timestamp,
-                    "host": host,
-                    "component": component,
-                    "message": message,
-                    "raw_line": line
-                }
-        
-        # Fallback for unparseable lines
+        timestamp, host, component, message = _parse_log_fields(line)
         return {
-            "timestamp": None,
-            "host": "unknown",
-            "component": "unknown",
-            "message": line,
+            "timestamp": timestamp,
+            "host": host,
+            "component": component,
+            "message": message,
             "raw_line": line
         }
     
@@ -280,75 +471,36 @@ class LogAnalysis:
                                   include_patterns: bool = True) -> Dict[str, Any]:
         """Analyze system logs"""
         try:
-            analysis = {
-                "timestamp": datetime.now().isoformat(),
-                "period_hours": hours_back,
-                "files_analyzed": [],
-                "total_lines": 0,
-                "error_count": 0,
-                "warning_count": 0,
-                "errors": [],
-                "warnings": [],
-                "patterns": {} if include_patterns else None
-            }
-            
             # Determine which files to analyze
             if log_path:
                 files_to_analyze = [log_path]
             else:
                 files_to_analyze = self.watch_paths
             
-            cutoff_time = datetime.now() - timedelta(hours=hours_back)
+            scan = await self._scan_files(files_to_analyze, hours_back, count_phrases=include_patterns)
             
-            for file_path in files_to_analyze:
-                if not Path(file_path).exists():
-                    continue
-                
-                file_analysis = {
-                    "file": file_path,
-                    "lines_analyzed": 0,
-                    "errors": 0,
-                    "warnings": 0
-                }
-                
-                lines = await self._read_log_file(file_path)
-                file_analysis["lines_analyzed"] = len(lines)
-                analysis["total_lines"] += len(lines)
-                
-                for line in lines:
-                    parsed = await self._parse_log_line(line)
-                    
-                    # Check if line is within time range
-                    if parsed["timestamp"] and parsed["timestamp"] < cutoff_time:
-                        continue
-                    
-                    # Check for errors and warnings
-                    message_lower = parsed["message"].lower()
-                    
-                    if any(pattern in message_lower for pattern in self.error_patterns):
-                        analysis["error_count"] += 1
-                        file_analysis["errors"] += 1
-                        analysis["errors"].append({
-                            "timestamp": parsed["timestamp"].isoformat() if parsed["timestamp"] else None,
-                            "component": parsed["component"],
-                            "message": parsed["message"],
-                            "file": file_path
-                        })
-                    elif "warning" in message_lower:
-                        analysis["warning_count"] += 1
-                        file_analysis["warnings"] += 1
-                        analysis["warnings"].append({
-                            "timestamp": parsed["timestamp"].isoformat() if parsed["timestamp"] else None,
-                            "component": parsed["component"],
-                            "message": parsed["message"],
-                            "file": file_path
-                        })
-                
-                analysis["files_analyzed"].append(file_analysis)
+            analysis = {
+                "timestamp": datetime.now().isoformat(),
+                "period_hours": hours_back,
+                "files_analyzed": scan.files_analyzed,
+                "total_lines": scan.total_lines,
+                "error_count": scan.error_count,
+                "warning_count": scan.warning_count,
+                "errors": [_log_entry(*entry) for entry in scan.errors],
+                "warnings": [_log_entry(*entry) for entry in scan.warnings],
+                "patterns": None
+            }
             
-            # Pattern analysis
+            # Pattern analysis over errors and warnings, from the counters kept during the scan
             if include_patterns:
-                analysis["patterns"] = await self._analyze_patterns(analysis["errors"] + analysis["warnings"])
+                analysis["patterns"] = {
+                    "common_phrases": {
+                        f"{first} {second}": count
+                        for (first, second), count in (scan.error_phrases + scan.warning_phrases).most_common(10)
+                    },
+                    "component_frequency": dict((scan.error_components + scan.warning_components).most_common(10)),
+                    "time_distribution": {}
+                }
             
             return {
                 "status": "success",
@@ -358,6 +510,26 @@ class LogAnalysis:
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    async def _scan_files(self, file_paths: List[str], hours_back: int,
+                          count_phrases: bool = False, count_error_types: bool = False) -> _LogScan:
+        """Classify every line of the given log files, each file on its own worker thread"""
+        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        file_paths = [file_path for file_path in file_paths if Path(file_path).exists()]
+        scan_args = (self.max_lines, cutoff_time, self._error_re, count_phrases, count_error_types)
+        
+        # One worker thread per file, off the event loop; file reads overlap
+        results = await asyncio.gather(*(
+            to_thread(_scan_one_file, file_path, *scan_args) for file_path in file_paths
+        ))
+        
+        # Merge in file order so counter tie order and recent entries match a serial scan
+        scan = _LogScan()
+        for file_path, (file_scan, read_error) in zip(file_paths, results):
+            if read_error:
+                self.logger.error(f"Error reading log file {file_path}: {read_error}")
+            scan.merge(file_scan)
+        return scan
+    
     async def _search_logs(self, query: str, log_path: Optional[str] = None, 
                           case_sensitive: bool = False, max_results: int = 100) -> Dict[str, Any]:
         """Search logs for specific patterns"""
@@ -377,8 +549,7 @@ class LogAnalysis:
                 files_to_search = self.watch_paths
             
             # Compile regex pattern
-            flags = 0 if case_sensitive else re.IGNORECASE
-            pattern = re.compile(query, flags)
+            pattern = _compile_client_pattern(query, ignore_case=not case_sensitive)
             
             for file_path in files_to_search:
                 if not Path(file_path).exists():
@@ -386,16 +557,16 @@ class LogAnalysis:
                 
                 lines = await self._read_log_file(file_path)
                 
-                for line in lines:
+                for line_number, line in enumerate(lines, 1):
                     if pattern.search(line):
-                        parsed = await self._parse_log_line(line)
+                        parsed = self._parse_log_line(line)
                         
                         search_results["results"].append({
                             "timestamp": parsed["timestamp"].isoformat() if parsed["timestamp"] else None,
                             "component": parsed["component"],
                             "message": parsed["message"],
                             "file": file_path,
-                            "line_number": lines.index(line) + 1
+                            "line_number": line_number
                         })
                         
                         search_results["total_matches"] += 1
@@ -418,54 +589,20 @@ class LogAnalysis:
                                 group_by_source: bool = True) -> Dict[str, Any]:
         """Get error summary"""
         try:
-            # First get all errors
-            analysis_result = await self._analyze_system_logs(hours_back=hours_back, include_patterns=False)
-            
-            if analysis_result["status"] != "success":
-                return analysis_result
-            
-            errors = analysis_result["data"]["errors"]
+            scan = await self._scan_files(self.watch_paths, hours_back, count_error_types=True)
             
             summary = {
                 "timestamp": datetime.now().isoformat(),
                 "period_hours": hours_back,
-                "total_errors": len(errors),
+                "total_errors": scan.error_count,
                 "error_frequency": {},
                 "top_components": {},
-                "error_types": {}
+                "error_types": dict(scan.error_types)
             }
             
             if group_by_source:
                 # Group by component/source
-                component_counts = {}
-                for error in errors:
-                    component = error["component"]
-                    component_counts[component] = component_counts.get(component, 0) + 1
-                
-                summary["top_components"] = dict(
-                    sorted(component_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-                )
-            
-            # Analyze error types
-            error_types = {}
-            for error in errors:
-                message_lower = error["message"].lower()
-                
-                # Categorize errors
-                if "timeout" in message_lower:
-                    error_types["timeout"] = error_types.get("timeout", 0) + 1
-                elif "connection" in message_lower:
-                    error_types["connection"] = error_types.get("connection", 0) + 1
-                elif "permission" in message_lower:
-                    error_types["permission"] = error_types.get("permission", 0) + 1
-                elif "disk" in message_lower or "storage" in message_lower:
-                    error_types["storage"] = error_types.get("storage", 0) + 1
-                elif "memory" in message_lower:
-                    error_types["memory"] = error_types.get("memory", 0) + 1
-                else:
-                    error_types["other"] = error_types.get("other", 0) + 1
-            
-            summary["error_types"] = error_types
+                summary["top_components"] = dict(scan.error_components.most_common(10))
             
             return {
                 "status": "success",
@@ -479,6 +616,7 @@ class LogAnalysis:
                                    duration_seconds: int = 60, 
                                    alert_threshold: int = 5) -> Dict[str, Any]:
         """Monitor logs for patterns in real-time"""
+        observer = None
         try:
             monitoring_results = {
                 "timestamp": datetime.now().isoformat(),
@@ -490,39 +628,76 @@ class LogAnalysis:
             }
             
             # Initialize pattern counts
+            pattern_counts = monitoring_results["pattern_counts"]
+            compiled_patterns = []
             for pattern in patterns:
-                monitoring_results["pattern_counts"][pattern] = 0
+                pattern_counts[pattern] = 0
+                compiled_patterns.append((pattern, _compile_client_pattern(pattern)))
+            
+            # One fused search rules out lines that match none of the patterns; only
+            # lines that match something are checked against each pattern
+            try:
+                any_pattern_re = _compile_client_pattern("|".join(f"(?:{pattern})" for pattern in patterns))
+            except re.error:
+                any_pattern_re = None
+            
+            # Only lines appended after monitoring starts are counted, each exactly once
+            log_paths = [os.path.abspath(path) for path in self.watch_paths if Path(path).exists()]
+            offsets = {path: os.path.getsize(path) for path in log_paths}
+            partial_lines = {path: b"" for path in log_paths}
+            alerted = set()
             
-            # Monitor for specified duration
-            start_time = datetime.now()
-            end_time = start_time + timedelta(seconds=duration_seconds)
+            # Wake up on inotify writes; the timeout below still catches missed events
+            changed = asyncio.Event()
+            try:
+                observer = Observer()
+                handler = _LogChangeHandler(asyncio.get_running_loop(), changed, log_paths)
+                for directory in {os.path.dirname(path) for path in log_paths}:
+                    observer.schedule(handler, directory, recursive=False)
+                observer.start()
+            except Exception as e:
+                self.logger.warning(f"File watching unavailable, polling logs instead: {e}")
+                observer = None
             
-            while datetime.now() < end_time:
-                # Check all log files
-                for log_path in self.watch_paths:
-                    if not Path(log_path).exists():
+            deadline = time.monotonic() + duration_seconds
+            
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=min(remaining, MONITOR_POLL_SECONDS))
+                except asyncio.TimeoutError:
+                    pass
+                changed.clear()
+                
+                # Read only what was appended since the last pass
+                for log_path in log_paths:
+                    data, offsets[log_path] = await to_thread(self._read_appended_sync, log_path, offsets[log_path])
+                    if not data:
                         continue
                     
-                    # Read recent lines
-                    lines = await self._read_log_file(log_path, max_lines=100)
+                    # Hold back a trailing partial line until its newline arrives
+                    data = partial_lines[log_path] + data
+                    complete, _, partial_lines[log_path] = data.rpartition(b"\n")
                     
-                    for line in lines:
-                        for pattern in patterns:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                monitoring_results["pattern_counts"][pattern] += 1
+                    for line in complete.decode("utf-8", errors="ignore").splitlines():
+                        if any_pattern_re is not None and not any_pattern_re.search(line):
+                            continue
+                        for pattern, pattern_re in compiled_patterns:
+                            if pattern_re.search(line):
+                                pattern_counts[pattern] += 1
                 
-                # Check for alerts
-                for pattern, count in monitoring_results["pattern_counts"].items():
-                    if count >= alert_threshold:
+                # Alert once per pattern, when its count first reaches the threshold
+                alert_time = None
+                for pattern, count in pattern_counts.items():
+                    if count >= alert_threshold and pattern not in alerted:
+                        if alert_time is None:
+                            alert_time = datetime.now().isoformat()
+                        alerted.add(pattern)
                         monitoring_results["alerts"].append({
                             "pattern": pattern,
                             "count": count,
                             "threshold": alert_threshold,
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": alert_time
                         })
-                
-                # Wait before next check
-                await asyncio.sleep(5)
             
             return {
                 "status": "success",
@@ -531,38 +706,25 @@ class LogAnalysis:
             
         except Exception as e:
             return {"status": "error", "error": str(e)}
+        finally:
+            if observer is not None:
+                observer.stop()
+                await to_thread(observer.join)
     
-    async def _analyze_patterns(self, log_entries: List[Dict]) -> Dict[str, Any]:
-        """Analyze patterns in log entries"""
-        patterns = {
-            "common_phrases": {},
-            "component_frequency": {},
-            "time_distribution": {}
-        }
-        
-        # Analyze common phrases
-        phrase_counts = {}
-        for entry in log_entries:
-            words = entry["message"].split()
-            for i in range(len(words) - 1):
-                phrase = f"{words[i]} {words[i+1]}"
-                phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
-        
-        patterns["common_phrases"] = dict(
-            sorted(phrase_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-        
-        # Analyze component frequency
-        component_counts = {}
-        for entry in log_entries:
-            component = entry["component"]
-            component_counts[component] = component_counts.get(component, 0) + 1
-        
-        patterns["component_frequency"] = dict(
-            sorted(component_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
-        
-        return patterns
+    def _read_appended_sync(self, log_path: str, offset: int) -> Tuple[bytes, int]:
+        """Read bytes appended to a file since offset, starting over if it was truncated or rotated"""
+        try:
+            fd = os.open(log_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return b"", 0
+        try:
+            size = os.fstat(fd).st_size
+            if size < offset:
+                offset = 0
+            data = os.pread(fd, size - offset, offset) if size > offset else b""
+        finally:
+            os.close(fd)
+        return data, offset + len(data)
     
     async def _generate_log_report(self, hours_back: int = 24, 
                                   include_trends: bool = True, 
@@ -613,4 +775,4 @@ class LogAnalysis:
     
     async def cleanup(self):
         """Cleanup resources"""
-        pass 
\ No newline at end of file
+        _parse_log_fields.cache_clear() 
\ No newline at end of file
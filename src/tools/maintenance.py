@@ -3,15 +3,12 @@ Maintenance Tools for Unraid MCP Server
 """
 
 import asyncio
-import json
 import logging
-import shutil
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import psutil
 import subprocess
-import os
 
 from . import Tool
 
@@ -24,14 +21,22 @@ class Maintenance:
         self.logger = logging.getLogger(__name__)
         self.cleanup_interval = config.get("cleanup_interval", 3600)
         self.auto_cleanup = config.get("auto_cleanup", True)
+        self._periodic_task: Optional[asyncio.Task] = None
         
     async def initialize(self):
         """Initialize the maintenance module"""
         self.logger.info("Initializing Maintenance module")
         
         if self.auto_cleanup:
-            # Start background cleanup task
-            asyncio.create_task(self._periodic_cleanup())
+            # Start background cleanup task, keeping a reference so it is not collected
+            self._periodic_task = asyncio.create_task(self._periodic_cleanup())
+            self._periodic_task.add_done_callback(self._on_periodic_done)
+    
+    def _on_periodic_done(self, task: asyncio.Task):
+        """Surface an unexpected exit of the periodic cleanup task"""
+        self._periodic_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Periodic cleanup stopped: {task.exception()}")
     
     async def get_tool_definitions(self) -> List[Tool]:
         """Return tool definitions for maintenance"""
@@ -2,12 +2,9 @@
 Plex Integration Tools for Unraid MCP Server
 """
 
-import asyncio
-import json
 import logging
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import requests
+from datetime import datetime
 import aiohttp
 import xml.etree.ElementTree as ET
 
@@ -195,6 +192,16 @@ class PlexIntegration:
             if response.status != 200:
                 raise Exception(f"Plex server returned status {response.status}")
     
+    async def health_check(self) -> Dict[str, Any]:
+        """Server health hook: whether the configured Plex server answers"""
+        if self.session is None:
+            return {"status": "disabled"}
+        try:
+            await self._test_connection()
+            return {"status": "success"}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    
     async def _get_plex_status(self, include_sessions: bool = True, include_libraries: bool = True) -> Dict[str, Any]:
         """Get Plex server status"""
         try:
@@ -5,9 +5,8 @@ System Diagnostics Tools for Unraid MCP Server
 import asyncio
 import json
 import logging
-import subprocess
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 import psutil
 import glob
 import os
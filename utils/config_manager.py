@@ -52,6 +52,7 @@ class ConfigManager:
                 "host": "0.0.0.0",
                 "port": 8080,
                 "workers": 4,
+                "max_concurrent_calls": 32,
                 "enable_auth": False,
                 "api_key": None
             },
@@ -95,6 +96,7 @@ class ConfigManager:
             "ENABLE_AUTH": ("server", "enable_auth"),
             "API_KEY": ("server", "api_key"),
             "MAX_WORKERS": ("server", "workers"),
+            "MAX_CONCURRENT_CALLS": ("server", "max_concurrent_calls"),
             "CACHE_TTL": ("cache", "ttl"),
             "HEALTH_CHECK_INTERVAL": ("health", "check_interval"),
             "CLEANUP_INTERVAL": ("tools", "maintenance", "cleanup_interval")
@@ -141,8 +143,11 @@ class ConfigManager:
             Path("/app/data/databases")
         ]
         
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Create shallowest paths first so children skip the ancestor walk
+        created = set()
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            directory.mkdir(parents=directory.parent not in created, exist_ok=True)
+            created.add(directory)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
@@ -0,0 +1,46 @@
+"""
+Event Loop Selection for Unraid MCP Server
+"""
+
+import asyncio
+import contextvars
+import functools
+import sys
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def install_event_loop_policy():
+    """Pick the event loop policy before any loop is created"""
+    if sys.platform == "win32":
+        # The default Proactor loop spins on idle stdio pipes; the selector loop does not
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return
+    
+    # Prefer the libuv-based event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+
+async def run_in_executor(executor: Optional[Executor], func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on executor (None: the loop's default), passing keyword arguments through
+    
+    The server sets no context variables, so the usual Context.run wrapper is
+    skipped unless the calling task actually carries some.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(executor, call)
+    return await loop.run_in_executor(executor, ctx.run, call)
+
+
+async def to_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """asyncio.to_thread for tool modules offloading blocking calls to the default executor"""
+    return await run_in_executor(None, func, *args, **kwargs)
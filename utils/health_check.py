@@ -49,7 +49,8 @@ def check_process():
         # Look for the main Python process
         for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
             try:
-                if 'python' in proc.info['name'] and '/app/src/main.py' in ' '.join(proc.info['cmdline']):
+                cmdline = ' '.join(proc.info['cmdline'] or [])
+                if 'python' in proc.info['name'] and ('src.main' in cmdline or 'src.dual_server' in cmdline):
                     print(f"Process check: PASS - PID {proc.info['pid']}")
                     return True
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -71,6 +72,7 @@ def check_files():
     """Check if required files exist"""
     required_files = [
         "/app/src/main.py",
+        "/app/src/dual_server.py",
         "/app/src/mcp_server.py",
         "/app/config/default_config.json"
     ]
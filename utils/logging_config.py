@@ -110,11 +110,11 @@ def log_function_call(func):
     """Decorator to log function calls"""
     def wrapper(*args, **kwargs):
         logger = logging.getLogger(func.__module__)
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        logger.debug("Calling %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} completed successfully")
+            logger.debug("%s completed successfully", func.__name__)
             return result
         except Exception as e:
             logger.error(f"{func.__name__} failed: {e}")
@@ -127,11 +127,11 @@ def log_async_function_call(func):
     """Decorator to log async function calls"""
     async def wrapper(*args, **kwargs):
         logger = logging.getLogger(func.__module__)
-        logger.debug(f"Calling async {func.__name__} with args={args}, kwargs={kwargs}")
+        logger.debug("Calling async %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
         
         try:
             result = await func(*args, **kwargs)
-            logger.debug(f"Async {func.__name__} completed successfully")
+            logger.debug("Async %s completed successfully", func.__name__)
             return result
         except Exception as e:
             logger.error(f"Async {func.__name__} failed: {e}")